@@ -13,4 +13,7 @@ from .device import DeviceHandler
 from .scene import SceneHandler
 from .view import ViewHandler
 from .midimap import MidiMapHandler
-from .constants import OSC_LISTEN_PORT, OSC_RESPONSE_PORT
+from .tick_monitor import TickMonitor
+from .profiler import TickProfiler
+from .memory import MemoryTracer, write_memory_report
+from .constants import OSC_LISTEN_PORT, OSC_RESPONSE_PORT, OSC_LEASE_DURATION, OSC_TICK_STATS_INTERVAL, OSC_PROFILE_TICKS
@@ -3,6 +3,10 @@ from typing import Tuple
 from .handler import AbletonOSCHandler
 
 class ApplicationHandler(AbletonOSCHandler):
+    def __init__(self, manager):
+        super().__init__(manager)
+        self.class_identifier = "application"
+
     def init_api(self):
         #--------------------------------------------------------------------------------
         # Generic callbacks
@@ -1,5 +1,5 @@
 import re
-from typing import Tuple, Callable, Any, Optional
+from typing import Tuple, Callable, Any, Dict, Optional
 from .handler import AbletonOSCHandler
 import Live
 
@@ -202,6 +202,11 @@ class ClipHandler(AbletonOSCHandler):
 
         self.osc_server.add_handler("/live/clips/unfilter", clips_unfilter_handler)
 
+    def get_memory_stats(self) -> Dict[str, int]:
+        stats = super().get_memory_stats()
+        stats["clip_notes_cache"] = sum(len(notes) for clip_slots in self._clip_notes_cache for notes in clip_slots)
+        return stats
+
     def _build_clip_name_cache(self):
         regex = "([_-])([A-G][A-G#b1-9-]*)$"
         for track_index, track in enumerate(self.song.tracks):
@@ -4,3 +4,125 @@
 
 OSC_LISTEN_PORT = 11000
 OSC_RESPONSE_PORT = 11001
+
+#--------------------------------------------------------------------------------
+# Maximum time to spend handling OSC messages per tick, in seconds, and the
+# maximum number of datagrams held over to the next tick once this is exceeded.
+#--------------------------------------------------------------------------------
+OSC_TICK_TIME_BUDGET = 0.05
+OSC_BACKLOG_SIZE = 10000
+
+#--------------------------------------------------------------------------------
+# If non-zero, replies sent within a tick are packed into OSC bundles of up to
+# this many bytes per destination. 1400 fits a typical Ethernet MTU; larger
+# values (e.g. 8192) are suitable for clients on the same host.
+#--------------------------------------------------------------------------------
+OSC_MAX_BUNDLE_SIZE = 0
+
+#--------------------------------------------------------------------------------
+# Port to accept TCP connections on, exchanging SLIP-framed OSC packets (OSC 1.1).
+# Used for replies too large to fit in a UDP datagram. Further connections
+# beyond OSC_MAX_TCP_CONNECTIONS are closed as soon as they are accepted.
+#--------------------------------------------------------------------------------
+OSC_TCP_LISTEN_PORT = 11000
+OSC_MAX_TCP_CONNECTIONS = 16
+
+#--------------------------------------------------------------------------------
+# If set, also listen for OSC datagrams on a Unix domain socket bound to this
+# path (e.g. "/tmp/abletonosc.sock"), for clients on the same host.
+# Not supported on Windows.
+#--------------------------------------------------------------------------------
+OSC_UNIX_SOCKET_PATH = None
+
+#--------------------------------------------------------------------------------
+# Replies larger than this many bytes are split into /live/fragment messages
+# when sent over UDP. Many OSC clients (including python-osc, used by
+# client/client.py) read at most 8192 bytes per datagram, and macOS rejects
+# UDP datagrams larger than 9216 bytes by default.
+#--------------------------------------------------------------------------------
+OSC_MAX_DATAGRAM_SIZE = 8192
+
+#--------------------------------------------------------------------------------
+# If non-zero, the maximum number of packets per second handled from each
+# client, with bursts of up to OSC_CLIENT_BURST packets. Excess packets are
+# queued (up to OSC_CLIENT_QUEUE_SIZE per client) and drained fairly between
+# clients, so that one client flooding the server can't starve the others.
+#--------------------------------------------------------------------------------
+OSC_CLIENT_RATE_LIMIT = 0
+OSC_CLIENT_BURST = 200
+OSC_CLIENT_QUEUE_SIZE = 1000
+
+#--------------------------------------------------------------------------------
+# Maximum number of listener updates queued during a tick, to be sent after
+# all replies. When full, the oldest updates are discarded.
+#--------------------------------------------------------------------------------
+OSC_MAX_QUEUED_UPDATES = 5000
+
+#--------------------------------------------------------------------------------
+# Number of recent request IDs remembered per client for /live/api/call, so
+# that retransmitted calls are acknowledged without being handled twice.
+#--------------------------------------------------------------------------------
+OSC_CALL_WINDOW_SIZE = 256
+
+#--------------------------------------------------------------------------------
+# If set, clients may opt in to receiving listener updates via this UDP
+# multicast group (e.g. "239.255.11.1"), on the response port, so that each
+# update is sent once however many clients are listening.
+#--------------------------------------------------------------------------------
+OSC_MULTICAST_GROUP = None
+OSC_MULTICAST_TTL = 1
+
+#--------------------------------------------------------------------------------
+# If non-zero, clients that send no messages for this many seconds are
+# unsubscribed from all listeners. Clients can send /live/api/heartbeat to
+# renew their lease while idle.
+#--------------------------------------------------------------------------------
+OSC_LEASE_DURATION = 0
+
+#--------------------------------------------------------------------------------
+# If set, the kernel receive and send buffer sizes of the UDP socket, in bytes.
+# By default, the operating system's defaults are used. Larger buffers absorb
+# larger bursts of messages; see /live/api/get/net_stats.
+#--------------------------------------------------------------------------------
+OSC_SOCKET_RECV_BUFFER_SIZE = None
+OSC_SOCKET_SEND_BUFFER_SIZE = None
+
+#--------------------------------------------------------------------------------
+# Maximum number of packets held per destination when the socket's send
+# buffer is full, to be retried on the next tick. When full, the oldest
+# listener update is discarded first.
+#--------------------------------------------------------------------------------
+OSC_SEND_BACKLOG_SIZE = 1000
+
+#--------------------------------------------------------------------------------
+# If True, the server records call counts, errors and timings for the handler
+# of each OSC address; see /live/api/get/stats. Disabled by default, as timing
+# each handler adds a small overhead to every message.
+#--------------------------------------------------------------------------------
+OSC_HANDLER_STATS_ENABLED = False
+
+#--------------------------------------------------------------------------------
+# Number of recent ticks whose timings are retained for /live/api/get/tick_stats,
+# and the number of ticks between tick stats sent to subscribed clients.
+#--------------------------------------------------------------------------------
+OSC_TICK_MONITOR_SIZE = 600
+OSC_TICK_STATS_INTERVAL = 10
+
+#--------------------------------------------------------------------------------
+# Default number of ticks profiled by /live/api/profile/start, and the number
+# of functions listed in its reply, ordered by cumulative time.
+#--------------------------------------------------------------------------------
+OSC_PROFILE_TICKS = 100
+OSC_PROFILE_TOP_FUNCTIONS = 20
+
+#--------------------------------------------------------------------------------
+# Number of allocation sites listed in memory reports when allocations are
+# traced with /live/api/memory/start_tracing.
+#--------------------------------------------------------------------------------
+OSC_MEMORY_TOP_SITES = 25
+
+#--------------------------------------------------------------------------------
+# Maximum number of bundles held until their time tag. Bundles received when
+# this many are already scheduled are discarded.
+#--------------------------------------------------------------------------------
+OSC_MAX_SCHEDULED_BUNDLES = 1000
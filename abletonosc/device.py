@@ -95,35 +95,25 @@ class DeviceHandler(AbletonOSCHandler):
             return param_index, device.parameters[param_index].str_for_value(device.parameters[param_index].value)
         
         def device_get_parameter_value_listener(device, params: Tuple[Any] = ()):
+            parameter = device.parameters[params[2]]
 
-            def property_changed_callback():
-                value = device.parameters[params[2]].value
+            def get_messages():
+                value = parameter.value
                 self.logger.info("Property %s changed of %s %s: %s" % ('value', 'device parameter', str(params), value))
-                self.osc_server.send("/live/device/get/parameter/value", (*params, value,))
-
-                value_string = device.parameters[params[2]].str_for_value(device.parameters[params[2]].value)
+                value_string = parameter.str_for_value(value)
                 self.logger.info("Property %s changed of %s %s: %s" % ('value_string', 'device parameter', str(params), value_string))
-                self.osc_server.send("/live/device/get/parameter/value_string", (*params, value_string,))
-
-            listener_key = ('device_parameter_value', tuple(params))
-            if listener_key in self.listener_functions:
-               device_get_parameter_remove_value_listener(device, params)
+                return [("/live/device/get/parameter/value", (*params, value,)),
+                        ("/live/device/get/parameter/value_string", (*params, value_string,))]
 
             self.logger.info("Adding listener for %s %s, property: %s" % ('device parameter', str(params), 'value'))
-            device.parameters[params[2]].add_value_listener(property_changed_callback)
-            self.listener_functions[listener_key] = property_changed_callback
-
-            property_changed_callback()
+            listener_key = ('device_parameter_value', tuple(params))
+            self._add_listener(listener_key, get_messages,
+                               parameter.add_value_listener,
+                               parameter.remove_value_listener)
 
         def device_get_parameter_remove_value_listener(device, params: Tuple[Any] = ()):
             listener_key = ('device_parameter_value', tuple(params))
-            if listener_key in self.listener_functions:
-                self.logger.info("Removing listener for %s %s, property %s" % (self.class_identifier, str(params), 'value'))
-                listener_function = self.listener_functions[listener_key]
-                device.parameters[params[2]].remove_value_listener(listener_function)
-                del self.listener_functions[listener_key]
-            else:
-                self.logger.warning("No listener function found for property: %s (%s)" % (prop, str(params)))
+            self._remove_listener(listener_key, self.osc_server.remote_addr)
 
         def device_set_parameter_value(device, params: Tuple[Any] = ()):
             param_index, param_value = params[:2]
@@ -136,7 +126,7 @@ class DeviceHandler(AbletonOSCHandler):
 
         self.osc_server.add_handler("/live/device/get/parameter/value", create_device_callback(device_get_parameter_value))
         self.osc_server.add_handler("/live/device/get/parameter/value_string", create_device_callback(device_get_parameter_value_string))
-        self.osc_server.add_handler("/live/device/set/parameter/value", create_device_callback(device_set_parameter_value))
+        self.osc_server.add_handler("/live/device/set/parameter/value", create_device_callback(device_set_parameter_value), coalesce=True)
         self.osc_server.add_handler("/live/device/get/parameter/name", create_device_callback(device_get_parameter_name))
         self.osc_server.add_handler("/live/device/start_listen/parameter/value", create_device_callback(device_get_parameter_value_listener, include_ids = True))
         self.osc_server.add_handler("/live/device/stop_listen/parameter/value", create_device_callback(device_get_parameter_remove_value_listener, include_ids = True))
@@ -0,0 +1,137 @@
+import struct
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from ..pythonosc.osc_message_builder import OscMessageBuilder, BuildError
+from ..pythonosc.parsing import osc_types
+
+#--------------------------------------------------------------------------------
+# Type tags and struct formats for fixed-size argument types.
+#--------------------------------------------------------------------------------
+_NUMERIC_FORMATS = {
+    "i": "i",
+    "h": "q",
+    "f": "f",
+}
+
+class OSCMessageEncoder:
+    def __init__(self, cache_size: int = 4096):
+        """
+        Encodes OSC messages to datagrams, for the types of argument returned by
+        AbletonOSC handlers (int, float, str, bytes, bool and None).
+
+        The padded address string is cached per address, and the type tag string
+        and argument packing code are cached per argument signature, so that a
+        stream of messages with the same shape (e.g. listener updates) only pays
+        for packing the argument values.
+
+        Arguments of any other type are encoded with OscMessageBuilder.
+
+        Args:
+            cache_size: Maximum number of addresses and signatures to cache.
+        """
+        self._cache_size = cache_size
+        self._addresses: Dict[str, bytes] = {}
+        self._layouts: Dict[Tuple, Optional[Tuple[bytes, Callable]]] = {}
+
+    @property
+    def cached_entries(self) -> int:
+        return len(self._addresses) + len(self._layouts)
+
+    def encode(self, address: str, params: Tuple = ()) -> bytes:
+        """
+        Returns the datagram for an OSC message.
+
+        Raises:
+            BuildError: If the message could not be encoded.
+            ValueError: If the type of an argument is not supported.
+        """
+        if not address:
+            raise BuildError("OSC addresses cannot be empty")
+
+        address_dgram = self._addresses.get(address)
+        if address_dgram is None:
+            try:
+                address_dgram = osc_types.write_string(address)
+            except osc_types.BuildError as e:
+                raise BuildError("Could not build the message: {}".format(e))
+            if len(self._addresses) >= self._cache_size:
+                self._addresses.clear()
+            self._addresses[address] = address_dgram
+
+        signature = tuple(_signature_type(param) for param in params)
+        if signature in self._layouts:
+            layout = self._layouts[signature]
+        else:
+            layout = _build_layout(signature)
+            if len(self._layouts) >= self._cache_size:
+                self._layouts.clear()
+            self._layouts[signature] = layout
+
+        if layout is None:
+            return self._encode_with_builder(address, params)
+
+        type_tag_dgram, pack = layout
+        try:
+            return address_dgram + type_tag_dgram + pack(params)
+        except (struct.error, OverflowError, osc_types.BuildError) as e:
+            raise BuildError("Could not build the message: {}".format(e))
+
+    def _encode_with_builder(self, address: str, params: Tuple) -> bytes:
+        msg_builder = OscMessageBuilder(address)
+        for param in params:
+            msg_builder.add_arg(param)
+        return msg_builder.build().dgram
+
+def _signature_type(param: Any) -> Any:
+    #--------------------------------------------------------------------------------
+    # Booleans are encoded in the type tag itself, and integers are encoded as int32
+    # or int64 depending on their value (following OscMessageBuilder), so these
+    # values have distinct signatures.
+    #--------------------------------------------------------------------------------
+    param_type = type(param)
+    if param_type is bool:
+        return "T" if param else "F"
+    if param_type is int and param.bit_length() > 32:
+        return "int64"
+    return param_type
+
+def _build_layout(signature: Tuple) -> Optional[Tuple[bytes, Callable]]:
+    """
+    Returns a tuple of (type_tag_dgram, pack), where pack(params) returns the encoded
+    argument values, or None if the signature contains unsupported types.
+    """
+    type_tags = ""
+    writers: List[Optional[Callable]] = []
+    for param_type in signature:
+        if param_type is str:
+            type_tags += "s"
+            writers.append(osc_types.write_string)
+        elif param_type is bytes:
+            type_tags += "b"
+            writers.append(osc_types.write_blob)
+        elif param_type in ("T", "F"):
+            type_tags += param_type
+            writers.append(None)
+        elif param_type is int:
+            type_tags += "i"
+            writers.append(struct.Struct(">i").pack)
+        elif param_type == "int64":
+            type_tags += "h"
+            writers.append(struct.Struct(">q").pack)
+        elif param_type is float:
+            type_tags += "f"
+            writers.append(struct.Struct(">f").pack)
+        elif param_type is type(None):
+            type_tags += "N"
+            writers.append(None)
+        else:
+            return None
+
+    type_tag_dgram = osc_types.write_string("," + type_tags)
+    if all(tag in _NUMERIC_FORMATS for tag in type_tags):
+        packer = struct.Struct(">" + "".join(_NUMERIC_FORMATS[tag] for tag in type_tags))
+        return type_tag_dgram, lambda params: packer.pack(*params)
+
+    return type_tag_dgram, lambda params: _pack_values(writers, params)
+
+def _pack_values(writers: List[Optional[Callable]], params: Tuple) -> bytes:
+    return b"".join(writer(param) for writer, param in zip(writers, params) if writer is not None)
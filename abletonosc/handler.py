@@ -1,5 +1,6 @@
 from ableton.v2.control_surface.component import Component
-from typing import Optional, Tuple, Any
+from typing import Optional, Tuple, Any, Callable, Dict, List
+from functools import partial
 import logging
 from .osc_server import OSCServer
 
@@ -12,7 +13,9 @@ class AbletonOSCHandler(Component):
         self.osc_server: OSCServer = self.manager.osc_server
         self.init_api()
         self.listener_functions = {}
-        self.listener_objects = {}
+        self.listener_clients = {}
+        self._listener_removers = {}
+        self._listener_getters = {}
         self.class_identifier = None
 
     def init_api(self):
@@ -58,7 +61,11 @@ class AbletonOSCHandler(Component):
             params:
             getter:
         """
-        def property_changed_callback():
+        add_listener_function = getattr(target, "add_%s_listener" % prop)
+        remove_listener_function = getattr(target, "remove_%s_listener" % prop)
+        osc_address = "/live/%s/get/%s" % (self.class_identifier, prop)
+
+        def get_messages():
             if getter is None:
                 value = getattr(target, prop)
             else:
@@ -66,51 +73,144 @@ class AbletonOSCHandler(Component):
             if type(value) is not tuple:
                 value = (value,)
             self.logger.info("Property %s changed of %s %s: %s" % (prop, self.class_identifier, str(params), value))
-            osc_address = "/live/%s/get/%s" % (self.class_identifier, prop)
-            self.osc_server.send(osc_address, (*params, *value,))
+            return [(osc_address, (*params, *value,))]
+
+        self.logger.info("Adding listener for %s %s, property: %s" % (self.class_identifier, str(params), prop))
+        listener_key = (prop, tuple(params))
+        self._add_listener(listener_key, get_messages, add_listener_function, remove_listener_function)
 
+    def _stop_listen(self, target, prop, params: Optional[Tuple[Any]] = ()) -> None:
         listener_key = (prop, tuple(params))
+        self._remove_listener(listener_key, self.osc_server.remote_addr)
+
+    def _add_listener(self,
+                      listener_key: Tuple,
+                      get_messages: Callable[[], List[Tuple[str, Tuple]]],
+                      add_listener_function: Callable,
+                      remove_listener_function: Callable) -> None:
+        """
+        Subscribe the client that sent the current OSC message to a Live listener.
+
+        Each Live listener is registered once, however many clients subscribe to it.
+        When it fires, the resulting messages are encoded once and sent to every
+        subscribed client. The current value is sent immediately to the new subscriber.
+
+        Args:
+            listener_key: Key identifying the property and object being listened to
+            get_messages: Function returning the list of (osc_address, params) messages
+                          describing the current value
+            add_listener_function: Live method used to add the listener
+            remove_listener_function: Live method used to remove the listener
+        """
+        client = self.osc_server.remote_addr
         if listener_key in self.listener_functions:
-            self._stop_listen(target, prop, params)
+            #--------------------------------------------------------------------------------
+            # The object at this index may have been replaced since the listener was added
+            # (e.g. a clip deleted and recreated), so the Live listener is always re-bound
+            # to the current target. Existing subscribers are kept.
+            #--------------------------------------------------------------------------------
+            try:
+                self._listener_removers[listener_key]()
+            except Exception as e:
+                self.logger.info("Exception whilst removing listener (likely benign): %s" % e)
+            clients = self.listener_clients[listener_key]
+        else:
+            clients = []
+
+        def property_changed_callback():
+            for osc_address, osc_params in get_messages():
+                self.osc_server.notify(osc_address, osc_params, clients, listener_key)
 
-        self.logger.info("Adding listener for %s %s, property: %s" % (self.class_identifier, str(params), prop))
-        add_listener_function_name = "add_%s_listener" % prop
-        add_listener_function = getattr(target, add_listener_function_name)
         add_listener_function(property_changed_callback)
         self.listener_functions[listener_key] = property_changed_callback
-        self.listener_objects[listener_key] = target
+        self.listener_clients[listener_key] = clients
+        self._listener_removers[listener_key] = partial(remove_listener_function, property_changed_callback)
+        self._listener_getters[listener_key] = get_messages
+
+        if client not in clients:
+            clients.append(client)
+
         #--------------------------------------------------------------------------------
         # Immediately send the current value
         #--------------------------------------------------------------------------------
-        property_changed_callback()
+        for osc_address, osc_params in get_messages():
+            self.osc_server.send(osc_address, osc_params, client)
 
-    def _stop_listen(self, target, prop, params: Optional[Tuple[Any]] = ()) -> None:
-        listener_key = (prop, tuple(params))
-        if listener_key in self.listener_functions:
-            self.logger.info("Removing listener for %s %s, property %s" % (self.class_identifier, str(params), prop))
-            listener_function = self.listener_functions[listener_key]
-            remove_listener_function_name = "remove_%s_listener" % prop
-            remove_listener_function = getattr(target, remove_listener_function_name)
-            try:
-                remove_listener_function(listener_function)
-            except Exception as e:
-                #--------------------------------------------------------------------------------
-                # This exception may be thrown when an observer is no longer connected --
-                # e.g., when trying to stop listening for a clip property of a clip that has been deleted.
-                # Ignore as it is benign.
-                #--------------------------------------------------------------------------------
-                self.logger.info("Exception whilst removing listener (likely benign): %s" % e)
+    def _remove_listener(self, listener_key: Tuple, client: Optional[Tuple[str, int]] = None) -> None:
+        """
+        Unsubscribe a client from a Live listener, removing the Live listener once it
+        has no more subscribers. If client is None, the listener is removed for all clients.
+        """
+        if listener_key not in self.listener_functions:
+            self.logger.warning("No listener function found for property: %s (%s)" % listener_key)
+            return
 
-            del self.listener_functions[listener_key]
-            del self.listener_objects[listener_key]
-        else:
-            self.logger.warning("No listener function found for property: %s (%s)" % (prop, str(params)))
+        clients = self.listener_clients[listener_key]
+        if client is not None:
+            if client in clients:
+                clients.remove(client)
+            if clients:
+                return
+
+        self.logger.info("Removing listener for %s %s, property %s" % (self.class_identifier, str(listener_key[1]), listener_key[0]))
+        try:
+            self._listener_removers[listener_key]()
+        except Exception as e:
+            #--------------------------------------------------------------------------------
+            # This exception may be thrown when an observer is no longer connected --
+            # e.g., when trying to stop listening for a clip property of a clip that has been deleted.
+            # Ignore as it is benign.
+            #--------------------------------------------------------------------------------
+            self.logger.info("Exception whilst removing listener (likely benign): %s" % e)
+
+        del self.listener_functions[listener_key]
+        del self.listener_clients[listener_key]
+        del self._listener_removers[listener_key]
+        del self._listener_getters[listener_key]
+
+    def get_subscribed_messages(self, client) -> List[Tuple[str, Tuple]]:
+        """
+        Returns the current value of every property that the given client is listening to,
+        as a list of (osc_address, params) messages.
+        """
+        messages = []
+        for listener_key, clients in self.listener_clients.items():
+            if client in clients:
+                try:
+                    messages += self._listener_getters[listener_key]()
+                except Exception as e:
+                    #--------------------------------------------------------------------------------
+                    # The object may have been deleted since the listener was added.
+                    #--------------------------------------------------------------------------------
+                    self.logger.info("Exception whilst getting value for %s (likely benign): %s" % (str(listener_key), e))
+        return messages
+
+    def release_client(self, client) -> int:
+        """
+        Unsubscribe a client from all listeners, e.g. when its lease has expired.
+
+        Returns:
+            The number of Live listeners removed because they had no remaining subscribers.
+        """
+        listener_count = len(self.listener_functions)
+        for listener_key, clients in list(self.listener_clients.items()):
+            if client in clients:
+                self._remove_listener(listener_key, client)
+        return listener_count - len(self.listener_functions)
+
+    def get_memory_stats(self) -> Dict[str, int]:
+        """
+        Returns the number of Live listeners, client subscriptions and cached items held
+        by this handler, for memory reports.
+        """
+        return {
+            "listeners": len(self.listener_functions),
+            "subscriptions": sum(len(clients) for clients in self.listener_clients.values()),
+        }
 
     def _clear_listeners(self):
         """
         Clears all listener functions, to prevent listeners continuing to report after a reload.
         """
-        for listener_key in list(self.listener_functions.keys())[:]:
-            target = self.listener_objects[listener_key]
-            prop, params = listener_key
-            self._stop_listen(target, prop, params)
+        for listener_key in list(self.listener_functions.keys()):
+            self._remove_listener(listener_key)
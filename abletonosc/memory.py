@@ -0,0 +1,93 @@
+import os
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+from .constants import OSC_MEMORY_TOP_SITES
+
+class MemoryTracer:
+    def __init__(self):
+        """
+        Traces memory allocations with tracemalloc, comparing the current allocations
+        against a baseline snapshot so that growth over a long session can be located.
+        """
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._baseline_bytes = 0
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int = 1) -> None:
+        """
+        Start tracing allocations, and take a baseline snapshot.
+
+        Args:
+            frames: Number of stack frames recorded for each allocation.
+        """
+        tracemalloc.start(frames)
+        self.take_baseline()
+
+    def stop(self) -> None:
+        tracemalloc.stop()
+        self._baseline = None
+
+    def take_baseline(self) -> None:
+        self._baseline = self._take_snapshot()
+        self._baseline_bytes = tracemalloc.get_traced_memory()[0]
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Returns the current and peak size of traced allocations, and the growth
+        since the baseline snapshot, in bytes.
+        """
+        if not self.tracing:
+            return {}
+        current, peak = tracemalloc.get_traced_memory()
+        stats = {"traced_bytes": current, "traced_peak_bytes": peak}
+        if self._baseline is not None:
+            stats["traced_bytes_since_baseline"] = current - self._baseline_bytes
+        return stats
+
+    def get_report(self, count: int = OSC_MEMORY_TOP_SITES) -> List[str]:
+        """
+        Returns lines describing the allocation sites holding the most memory, and the
+        allocation sites that have grown the most since the baseline snapshot.
+        """
+        if not self.tracing:
+            return []
+        snapshot = self._take_snapshot()
+        lines = ["Top %d allocation sites:" % count]
+        lines += ["  %s" % stat for stat in snapshot.statistics("lineno")[:count]]
+        if self._baseline is not None:
+            lines += ["", "Top %d changes since baseline:" % count]
+            lines += ["  %s" % stat for stat in snapshot.compare_to(self._baseline, "lineno")[:count]]
+        return lines
+
+    def _take_snapshot(self) -> tracemalloc.Snapshot:
+        #--------------------------------------------------------------------------------
+        # Exclude tracemalloc's own allocations, which would otherwise grow with
+        # each snapshot taken.
+        #--------------------------------------------------------------------------------
+        return tracemalloc.take_snapshot().filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),))
+
+def write_memory_report(log_dir: str, stats: Dict[str, int], report: List[str]) -> str:
+    """
+    Write a memory report to a timestamped text file in log_dir.
+
+    Args:
+        log_dir: Directory to write the report to.
+        stats: Name/value pairs to include at the top of the report.
+        report: Further lines to include, e.g. from MemoryTracer.get_report().
+
+    Returns:
+        The path of the report.
+    """
+    path = os.path.join(log_dir, "memory-%s.txt" % time.strftime("%Y%m%d-%H%M%S"))
+    with open(path, "w") as fd:
+        fd.write("AbletonOSC memory report, %s\n\n" % time.strftime("%Y-%m-%d %H:%M:%S"))
+        for name, value in stats.items():
+            fd.write("%s: %s\n" % (name, value))
+        if report:
+            fd.write("\n" + "\n".join(report) + "\n")
+    return path
@@ -1,19 +1,87 @@
-from typing import Tuple, Any, Callable
-from .constants import OSC_LISTEN_PORT, OSC_RESPONSE_PORT
+from typing import Tuple, Any, Callable, Dict, Iterator, List, Optional
+from .constants import OSC_LISTEN_PORT, OSC_RESPONSE_PORT, OSC_TICK_TIME_BUDGET, OSC_BACKLOG_SIZE, OSC_MAX_BUNDLE_SIZE, \
+    OSC_TCP_LISTEN_PORT, OSC_UNIX_SOCKET_PATH, OSC_MAX_DATAGRAM_SIZE, OSC_CLIENT_RATE_LIMIT, OSC_CLIENT_BURST, \
+    OSC_CLIENT_QUEUE_SIZE, OSC_MAX_QUEUED_UPDATES, OSC_CALL_WINDOW_SIZE, OSC_MULTICAST_GROUP, OSC_MULTICAST_TTL, \
+    OSC_SOCKET_RECV_BUFFER_SIZE, OSC_SOCKET_SEND_BUFFER_SIZE, OSC_SEND_BACKLOG_SIZE, OSC_HANDLER_STATS_ENABLED, \
+    OSC_MAX_SCHEDULED_BUNDLES, OSC_MAX_TCP_CONNECTIONS
+from .router import OSCRouter, is_address_pattern
+from .encoder import OSCMessageEncoder
+from .tcp import TCPConnection
+from .rate_limiter import ClientRateLimiter
+from .stats import HandlerStats
 from ..pythonosc.osc_message import OscMessage, ParseError
 from ..pythonosc.osc_bundle import OscBundle
-from ..pythonosc.osc_message_builder import OscMessageBuilder, BuildError
+from ..pythonosc.osc_message_builder import BuildError
+from ..pythonosc.parsing import osc_types
 
-import re
+import os
+import time
+import heapq
 import errno
+import collections
 import socket
 import logging
 import traceback
 
+#--------------------------------------------------------------------------------
+# Bundle prefix and "immediately" time tag, prepended to outgoing bundles.
+#--------------------------------------------------------------------------------
+_BUNDLE_HEADER = b"#bundle\x00" + osc_types.write_date(osc_types.IMMEDIATELY)
+
+#--------------------------------------------------------------------------------
+# Packets too large to send in a single datagram are split into fragments, each
+# sent as a message to this address with params (fragment_id, index, count, blob).
+# The overhead is the size of a fragment message excluding the blob contents.
+#--------------------------------------------------------------------------------
+FRAGMENT_ADDRESS = "/live/fragment"
+_FRAGMENT_OVERHEAD = 64
+
+#--------------------------------------------------------------------------------
+# Listener updates to clients that have enabled sequence numbers are sent to this
+# address, with params (sequence_number, address, *params).
+#--------------------------------------------------------------------------------
+UPDATE_ADDRESS = "/live/update"
+
+#--------------------------------------------------------------------------------
+# Errors raised by sendto() when the socket's send buffer is full. ENOBUFS is
+# raised on macOS where other platforms raise EAGAIN.
+#--------------------------------------------------------------------------------
+_WOULD_BLOCK_ERRORS = (errno.EAGAIN, errno.EWOULDBLOCK, errno.ENOBUFS)
+
+#--------------------------------------------------------------------------------
+# Acknowledged calls. A message to CALL_ADDRESS with params (request_id, address,
+# *params) is handled as a message to address, and answered with an ack or nack
+# carrying the request_id. Repeated request_ids are answered without handling
+# the message again.
+#--------------------------------------------------------------------------------
+CALL_ADDRESS = "/live/api/call"
+ACK_ADDRESS = "/live/api/ack"
+NACK_ADDRESS = "/live/api/nack"
+
+#--------------------------------------------------------------------------------
+# Errors are counted per address, but errors handling address patterns are counted
+# under this single key, so that the counts can't grow without bound as clients
+# send distinct (e.g. malformed) patterns.
+#--------------------------------------------------------------------------------
+PATTERN_ERROR_KEY = "pattern"
+
 class OSCServer:
     def __init__(self,
                  local_addr: Tuple[str, int] = ('0.0.0.0', OSC_LISTEN_PORT),
-                 remote_addr: Tuple[str, int] = ('127.0.0.1', OSC_RESPONSE_PORT)):
+                 remote_addr: Tuple[str, int] = ('127.0.0.1', OSC_RESPONSE_PORT),
+                 time_budget: Optional[float] = OSC_TICK_TIME_BUDGET,
+                 backlog_size: int = OSC_BACKLOG_SIZE,
+                 max_bundle_size: int = OSC_MAX_BUNDLE_SIZE,
+                 zero_copy: bool = True,
+                 tcp_port: Optional[int] = OSC_TCP_LISTEN_PORT,
+                 unix_path: Optional[str] = OSC_UNIX_SOCKET_PATH,
+                 max_datagram_size: int = OSC_MAX_DATAGRAM_SIZE,
+                 client_rate_limit: float = OSC_CLIENT_RATE_LIMIT,
+                 client_burst: int = OSC_CLIENT_BURST,
+                 multicast_group: Optional[str] = OSC_MULTICAST_GROUP,
+                 multicast_ttl: int = OSC_MULTICAST_TTL,
+                 socket_recv_buffer_size: Optional[int] = OSC_SOCKET_RECV_BUFFER_SIZE,
+                 socket_send_buffer_size: Optional[int] = OSC_SOCKET_SEND_BUFFER_SIZE):
         """
         Class that handles OSC server responsibilities, including support for sending
         reply messages.
@@ -27,6 +95,37 @@ class OSCServer:
                         By default, binds to the wildcard address 0.0.0.0, which means listening on
                         every available local IPv4 interface (including 127.0.0.1).
             remote_addr: Remote address to send replies to, by default. Can be overridden in send().
+            time_budget: Maximum time to spend processing messages in each call to process(), in seconds.
+                         If None, all pending messages are processed.
+            backlog_size: Maximum number of datagrams held over to the next call to process()
+                          when the time budget is exhausted. Further datagrams are left in
+                          the socket's receive buffer.
+            max_bundle_size: If non-zero, messages sent during process() are buffered per remote
+                             address and sent by flush() as OSC bundles of up to this many bytes.
+            zero_copy: If True, datagrams are received into a preallocated buffer and parsed
+                       in place via memoryview, rather than allocating a new bytes object
+                       for each datagram.
+            tcp_port: If set, also accept TCP connections on this port, exchanging SLIP-framed
+                      OSC packets (OSC 1.1). Replies to messages received over TCP are sent back
+                      over the same connection, so are not limited by the size of a UDP datagram.
+            unix_path: If set, also listen for datagrams on a Unix domain socket bound to this path,
+                       for clients running on the same host. Replies are sent to the path that the
+                       client's socket is bound to.
+            max_datagram_size: Packets larger than this many bytes are split into fragments
+                               when sent over UDP or the Unix socket. If zero, packets are
+                               never fragmented.
+            client_rate_limit: If non-zero, the maximum number of packets per second handled from
+                               each client. Excess packets are queued, and queues are drained
+                               in round-robin order between clients.
+            client_burst: Number of packets a client may send in a burst above client_rate_limit.
+            multicast_group: If set, listener updates for clients that enable multicast are sent
+                             once to this multicast group (on the response port), rather than
+                             to each client individually.
+            multicast_ttl: Time-to-live of multicast packets. 1 restricts them to the local network.
+            socket_recv_buffer_size: If set, the size of the kernel receive buffer (SO_RCVBUF) for
+                                     the UDP and Unix sockets, in bytes.
+            socket_send_buffer_size: If set, the size of the kernel send buffer (SO_SNDBUF) for
+                                     the UDP and Unix sockets, in bytes.
         """
 
         self._local_addr = local_addr
@@ -36,13 +135,121 @@ class OSCServer:
         self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self._socket.setblocking(0)
         self._socket.bind(self._local_addr)
+        self.rx_packets = 0
+        self.rx_bytes = 0
+        self.tx_packets = 0
+        self.tx_bytes = 0
+        self.tx_eagain = 0
+        self.send_backlog_size = OSC_SEND_BACKLOG_SIZE
+        self.sends_deferred = 0
+        self.send_backlog_dropped = 0
+        self._send_backlogs = {}
+        self._recv_buffer = bytearray(65536) if zero_copy else None
+        self._recv_view = memoryview(self._recv_buffer) if zero_copy else None
         self._callbacks = {}
+        self._router = OSCRouter()
+        self._coalesced_addresses = set()
+        self._pending_writes = {}
+        self.writes_coalesced = 0
+        self._encoder = OSCMessageEncoder()
+        self.error_counts = collections.Counter()
+        self.messages_handled = 0
+        self.stats_enabled = OSC_HANDLER_STATS_ENABLED
+        self.handler_stats = HandlerStats()
+
+        self.time_budget = time_budget
+        self.budget_overruns = 0
+        self.backlog_full = 0
+        self._backlog = collections.deque(maxlen=backlog_size)
+        self.rate_limiter = ClientRateLimiter(client_rate_limit, client_burst, OSC_CLIENT_QUEUE_SIZE)
+
+        self.max_bundle_size = max_bundle_size
+        self.bundles_sent = 0
+        self._batching = False
+        self._outbox = {}
+
+        self.max_queued_updates = OSC_MAX_QUEUED_UPDATES
+        self.updates_coalesced = 0
+        self.updates_dropped = 0
+        self._update_queue = collections.OrderedDict()
+        self._sequence_numbers = {}
+
+        self.call_window_size = OSC_CALL_WINDOW_SIZE
+        self.calls_duplicated = 0
+        self._call_windows = {}
+
+        self._client_last_seen = {}
+        self.leases_expired = 0
+
+        self._multicast_addr = None
+        self._multicast_clients = set()
+        if multicast_group is not None:
+            #--------------------------------------------------------------------------------
+            # Multicast packets are looped back, so that clients on the same host as Live
+            # also receive them.
+            #--------------------------------------------------------------------------------
+            self._socket.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, multicast_ttl)
+            self._socket.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+            if self._local_addr[0] != "0.0.0.0":
+                self._socket.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(self._local_addr[0]))
+            self._multicast_addr = (multicast_group, self._response_port)
+
+        self.max_scheduled_bundles = OSC_MAX_SCHEDULED_BUNDLES
+        self.scheduled_bundles_dropped = 0
+        self._scheduled_bundles = []
+        self._scheduled_count = 0
+
+        self.max_datagram_size = max_datagram_size
+        self.fragmented_packets = 0
+        self._next_fragment_id = 0
 
         self.logger = logging.getLogger("abletonosc")
+
+        self.max_tcp_connections = OSC_MAX_TCP_CONNECTIONS
+        self._tcp_connections: List[TCPConnection] = []
+        self._tcp_packets = collections.deque()
+        self._closed_clients = []
+        self._tcp_socket = None
+        if tcp_port is not None:
+            try:
+                self._tcp_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                self._tcp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                self._tcp_socket.setblocking(0)
+                self._tcp_socket.bind((self._local_addr[0], tcp_port))
+                self._tcp_socket.listen(8)
+            except OSError:
+                #--------------------------------------------------------------------------------
+                # UDP remains available if the TCP port is in use.
+                #--------------------------------------------------------------------------------
+                self.logger.warning("AbletonOSC: Couldn't listen for TCP connections on port %d: %s" % (tcp_port, traceback.format_exc()))
+                self._tcp_socket.close()
+                self._tcp_socket = None
+
+        self._unix_path = unix_path
+        self._unix_socket = None
+        if unix_path is not None:
+            try:
+                if os.path.exists(unix_path):
+                    os.unlink(unix_path)
+                self._unix_socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+                self._unix_socket.setblocking(0)
+                self._unix_socket.bind(unix_path)
+            except (OSError, AttributeError):
+                #--------------------------------------------------------------------------------
+                # AF_UNIX datagram sockets are not available on Windows.
+                #--------------------------------------------------------------------------------
+                self.logger.warning("AbletonOSC: Couldn't listen on Unix socket %s: %s" % (unix_path, traceback.format_exc()))
+                if self._unix_socket is not None:
+                    self._unix_socket.close()
+                    self._unix_socket = None
+        self._read_unix_first = False
+
+        self.set_socket_buffer_sizes(socket_recv_buffer_size, socket_send_buffer_size)
+
         self.logger.info("Starting OSC server (local %s, response port %d)",
                          str(self._local_addr), self._response_port)
 
-    def add_handler(self, address: str, handler: Callable) -> None:
+    def add_handler(self, address: str, handler: Callable, coalesce: bool = False) -> None:
         """
         Add an OSC handler.
 
@@ -50,14 +257,25 @@ class OSCServer:
             address: The OSC address string
             handler: A handler function, with signature:
                      params: Tuple[Any, ...]
+            coalesce: If True, the handler sets a value, given by the last param, on the object
+                      identified by the preceding params. When several messages for the same
+                      object are received within one call to process(), only the last is handled.
         """
         self._callbacks[address] = handler
+        self._router.add(address, handler)
+        if coalesce:
+            self._coalesced_addresses.add(address)
+        else:
+            self._coalesced_addresses.discard(address)
 
     def clear_handlers(self) -> None:
         """
         Remove all existing OSC handlers.
         """
         self._callbacks = {}
+        self._router.clear()
+        self._coalesced_addresses = set()
+        self._pending_writes = {}
 
     def send(self,
              address: str,
@@ -72,36 +290,369 @@ class OSCServer:
             remote_addr: The remote address to send to, as a 2-tuple (hostname, port).
                          If None, uses the default remote address.
         """
-        msg_builder = OscMessageBuilder(address)
-        for param in params:
-            msg_builder.add_arg(param)
-
         try:
-            msg = msg_builder.build()
+            dgram = self._encoder.encode(address, params)
             if remote_addr is None:
                 remote_addr = self._remote_addr
-            self._socket.sendto(msg.dgram, remote_addr)
+            self._send_dgram(dgram, remote_addr)
+        except BuildError:
+            self.logger.error("AbletonOSC: OSC build error: %s" % (traceback.format_exc()))
+        except OSError:
+            self.logger.warning("AbletonOSC: Couldn't send to %s: %s" % (str(remote_addr), traceback.format_exc()))
+
+    def notify(self,
+               address: str,
+               params: Tuple,
+               remote_addrs: List[Tuple[str, int]],
+               key: Optional[Any] = None) -> None:
+        """
+        Send an OSC message to each of a list of remote addresses, encoding it once.
+        Used to deliver listener updates to every subscribed client.
+
+        Updates sent during process() are given lower priority than replies: they are
+        queued and sent by flush() after all replies. Within the queue, an update with
+        the same address and key as an earlier update to the same client replaces it.
+        Updates triggered by changes in Live between ticks (e.g. the current beat) are
+        sent immediately, so that their timing is preserved.
+
+        Args:
+            address: The OSC address (e.g. /frequency)
+            params: A tuple of zero or more OSC params
+            remote_addrs: The remote addresses to send to, as a list of 2-tuples (hostname, port).
+            key: Identifies the object that the update describes. If None, the update
+                 is never replaced by a later one.
+        """
+        try:
+            dgram = self._encoder.encode(address, params)
         except BuildError:
             self.logger.error("AbletonOSC: OSC build error: %s" % (traceback.format_exc()))
+            return
+
+        if self._multicast_clients:
+            #--------------------------------------------------------------------------------
+            # A single packet to the multicast group replaces the packets to every
+            # subscribed client that has enabled multicast.
+            #--------------------------------------------------------------------------------
+            unicast_addrs = [remote_addr for remote_addr in remote_addrs if remote_addr not in self._multicast_clients]
+            if len(unicast_addrs) < len(remote_addrs):
+                remote_addrs = unicast_addrs + [self._multicast_addr]
+
+        for remote_addr in remote_addrs:
+            if self._batching:
+                update = (address, params, dgram)
+                self._queue_update(update, remote_addr, (address, key) if key is not None else object())
+                continue
+            try:
+                self._transmit(self._encode_update(address, params, dgram, remote_addr), remote_addr, is_update=True)
+            except (OSError, BuildError):
+                self.logger.warning("AbletonOSC: Couldn't send to %s: %s" % (str(remote_addr), traceback.format_exc()))
+
+    def notify_bundle(self, messages: List[Tuple[str, Tuple]], remote_addr) -> None:
+        """
+        Send a list of listener updates to a single client, as one OSC bundle.
+
+        Args:
+            messages: A list of (address, params) tuples.
+            remote_addr: The remote address to send to.
+        """
+        try:
+            dgrams = [self._encode_update(address, params, self._encoder.encode(address, params), remote_addr)
+                      for address, params in messages]
+        except BuildError:
+            self.logger.error("AbletonOSC: OSC build error: %s" % (traceback.format_exc()))
+            return
+        if dgrams:
+            self._send_dgram(self._build_bundle(dgrams), remote_addr)
+
+    def set_sequence_numbers(self, remote_addr, enabled: bool) -> None:
+        """
+        Enable or disable sequence numbers on listener updates sent to a client.
+
+        When enabled, each update is sent to UPDATE_ADDRESS, prefixed by the address it
+        would otherwise have been sent to and a sequence number that increments by one
+        per update sent to that client, so that the client can detect lost updates.
+        """
+        if enabled:
+            self._sequence_numbers.setdefault(remote_addr, 0)
+        else:
+            self._sequence_numbers.pop(remote_addr, None)
+
+    @property
+    def multicast_addr(self) -> Optional[Tuple[str, int]]:
+        """
+        The multicast group and port that listener updates are sent to, or None if multicast is not configured.
+        """
+        return self._multicast_addr
+
+    def set_multicast(self, remote_addr, enabled: bool) -> None:
+        """
+        Enable or disable receiving listener updates for a client via the multicast group.
+        The client must join the multicast group to receive them.
+
+        Raises:
+            RuntimeError: If no multicast group is configured.
+        """
+        if enabled:
+            if self._multicast_addr is None:
+                raise RuntimeError("Multicast is not configured (see OSC_MULTICAST_GROUP)")
+            if not isinstance(remote_addr, tuple):
+                raise RuntimeError("Multicast is only available to UDP clients")
+            self._multicast_clients.add(remote_addr)
+        else:
+            self._multicast_clients.discard(remote_addr)
+
+    def _encode_update(self, address: str, params: Tuple, dgram: bytes, remote_addr) -> bytes:
+        if remote_addr not in self._sequence_numbers:
+            return dgram
+        sequence_number = (self._sequence_numbers[remote_addr] + 1) % (1 << 31)
+        self._sequence_numbers[remote_addr] = sequence_number
+        return self._encoder.encode(UPDATE_ADDRESS, (sequence_number, address, *params))
+
+    def _queue_update(self, update: Tuple[str, Tuple, bytes], remote_addr, key: Any) -> None:
+        queue_key = (remote_addr, key)
+        if self._update_queue.pop(queue_key, None) is not None:
+            self.updates_coalesced += 1
+        elif len(self._update_queue) >= self.max_queued_updates:
+            self._update_queue.popitem(last=False)
+            self.updates_dropped += 1
+        self._update_queue[queue_key] = update
+
+    def _send_dgram(self, dgram: bytes, remote_addr: Tuple[str, int]) -> None:
+        if self._batching and self.max_bundle_size:
+            if remote_addr not in self._outbox:
+                self._outbox[remote_addr] = []
+            self._outbox[remote_addr].append(dgram)
+        else:
+            self._transmit(dgram, remote_addr)
+
+    def _transmit(self, packet: bytes, remote_addr, is_update: bool = False) -> None:
+        #--------------------------------------------------------------------------------
+        # Clients connected over TCP are identified by their TCPConnection object,
+        # which is used in place of a (hostname, port) reply address.
+        # Clients connected over the Unix socket are identified by the path that
+        # their socket is bound to. Clients with unbound sockets can't be replied to.
+        # TCP clients are recognised as neither tuples nor paths, rather than by
+        # their class, as connections opened before /live/api/reload are instances
+        # of the TCPConnection class from before the reload.
+        #--------------------------------------------------------------------------------
+        if isinstance(remote_addr, tuple):
+            self._send_datagram(self._socket, packet, remote_addr, is_update)
+        elif isinstance(remote_addr, str):
+            if remote_addr:
+                self._send_datagram(self._unix_socket, packet, remote_addr, is_update)
+        else:
+            remote_addr.send(packet)
+            self.tx_packets += 1
+            self.tx_bytes += len(packet)
+
+    def _send_datagram(self, sock: socket.socket, packet: bytes, remote_addr, is_update: bool = False) -> None:
+        if self.max_datagram_size and len(packet) > self.max_datagram_size:
+            for fragment in self._fragment(packet):
+                self._send_or_defer(sock, fragment, remote_addr, is_update)
+        else:
+            self._send_or_defer(sock, packet, remote_addr, is_update)
+
+    def _send_or_defer(self, sock: socket.socket, packet: bytes, remote_addr, is_update: bool) -> None:
+        #--------------------------------------------------------------------------------
+        # If the socket's send buffer is full, the packet is held in a backlog for its
+        # destination, and retried by the next call to flush(). Once a destination has
+        # a backlog, later packets join it, so that packets are sent in order.
+        #--------------------------------------------------------------------------------
+        backlog = self._send_backlogs.get(remote_addr)
+        if backlog is None:
+            try:
+                self._sendto(sock, packet, remote_addr)
+                return
+            except OSError as e:
+                if e.errno not in _WOULD_BLOCK_ERRORS:
+                    raise
+            backlog = self._send_backlogs[remote_addr] = collections.deque()
+
+        if len(backlog) >= self.send_backlog_size and not self._drop_from_send_backlog(backlog, is_update):
+            return
+        backlog.append((sock, packet, is_update))
+        self.sends_deferred += 1
+
+    def _drop_from_send_backlog(self, backlog: collections.deque, is_update: bool) -> bool:
+        """
+        Make room in a full send backlog for a new packet.
+
+        Returns:
+            True if a queued packet was discarded, or False if the new packet should be
+            discarded instead.
+        """
+        #--------------------------------------------------------------------------------
+        # Listener updates are dropped in preference to replies, as a later update
+        # will supersede them. A new update is discarded rather than evicting a reply.
+        #--------------------------------------------------------------------------------
+        self.send_backlog_dropped += 1
+        for index, (_, _, queued_is_update) in enumerate(backlog):
+            if queued_is_update:
+                del backlog[index]
+                return True
+        if is_update:
+            return False
+        backlog.popleft()
+        return True
+
+    def _retry_send_backlogs(self) -> None:
+        for remote_addr, backlog in list(self._send_backlogs.items()):
+            while backlog:
+                sock, packet, _ = backlog[0]
+                try:
+                    self._sendto(sock, packet, remote_addr)
+                except OSError as e:
+                    if e.errno in _WOULD_BLOCK_ERRORS:
+                        break
+                    self.logger.warning("AbletonOSC: Couldn't send to %s: %s" % (str(remote_addr), traceback.format_exc()))
+                backlog.popleft()
+            if not backlog:
+                del self._send_backlogs[remote_addr]
+
+    def _sendto(self, sock: socket.socket, packet: bytes, remote_addr) -> None:
+        try:
+            sock.sendto(packet, remote_addr)
+        except OSError as e:
+            if e.errno in _WOULD_BLOCK_ERRORS:
+                self.tx_eagain += 1
+            raise
+        self.tx_packets += 1
+        self.tx_bytes += len(packet)
+
+    def _fragment(self, packet: bytes) -> Iterator[bytes]:
+        """
+        Split a packet into fragment messages of no more than max_datagram_size bytes.
+        All fragments of a packet share a fragment_id, which the client uses to reassemble them.
+        """
+        chunk_size = max(self.max_datagram_size - _FRAGMENT_OVERHEAD, 1)
+        count = (len(packet) + chunk_size - 1) // chunk_size
+        fragment_id = self._next_fragment_id
+        self._next_fragment_id = (self._next_fragment_id + 1) % (1 << 31)
+        self.fragmented_packets += 1
+        for index in range(count):
+            chunk = packet[index * chunk_size:(index + 1) * chunk_size]
+            yield self._encoder.encode(FRAGMENT_ADDRESS, (fragment_id, index, count, chunk))
+
+    def _reply_addr(self, remote_addr):
+        if isinstance(remote_addr, tuple):
+            return (remote_addr[0], self._response_port)
+        return remote_addr
+
+    def flush(self) -> None:
+        """
+        Send all messages buffered during the current tick: first replies, then listener
+        updates. Messages for each remote address are packed into OSC bundles of up to
+        max_bundle_size bytes.
+        """
+        self._batching = False
+        self._retry_send_backlogs()
+        self._send_outbox()
+        update_queue, self._update_queue = self._update_queue, collections.OrderedDict()
+        for (remote_addr, _), (address, params, dgram) in update_queue.items():
+            try:
+                dgram = self._encode_update(address, params, dgram, remote_addr)
+            except BuildError:
+                self.logger.error("AbletonOSC: OSC build error: %s" % (traceback.format_exc()))
+                continue
+            if remote_addr not in self._outbox:
+                self._outbox[remote_addr] = []
+            self._outbox[remote_addr].append(dgram)
+        self._send_outbox(is_update=True)
+
+    def _send_outbox(self, is_update: bool = False) -> None:
+        outbox, self._outbox = self._outbox, {}
+        for remote_addr, dgrams in outbox.items():
+            try:
+                for packet in self._pack_bundles(dgrams):
+                    self._transmit(packet, remote_addr, is_update)
+            except OSError:
+                self.logger.warning("AbletonOSC: Couldn't send to %s: %s" % (str(remote_addr), traceback.format_exc()))
+
+    def _pack_bundles(self, dgrams: List[bytes]) -> Iterator[bytes]:
+        """
+        Group the given message datagrams into as few bundles as possible, each no larger
+        than max_bundle_size. A group containing a single message is sent as-is.
+        """
+        group = []
+        group_size = len(_BUNDLE_HEADER)
+        for dgram in dgrams:
+            element_size = 4 + len(dgram)
+            if group and group_size + element_size > self.max_bundle_size:
+                yield self._build_bundle(group)
+                group = []
+                group_size = len(_BUNDLE_HEADER)
+            group.append(dgram)
+            group_size += element_size
+        if group:
+            yield self._build_bundle(group)
+
+    def _build_bundle(self, dgrams: List[bytes]) -> bytes:
+        if len(dgrams) == 1:
+            return dgrams[0]
+        self.bundles_sent += 1
+        return _BUNDLE_HEADER + b"".join(osc_types.write_int(len(dgram)) + dgram for dgram in dgrams)
 
     def process_message(self, message, remote_addr):
-        if message.address in self._callbacks:
-            callback = self._callbacks[message.address]
-            rv = callback(message.params)
-
-            if rv is not None:
-                assert isinstance(rv, tuple)
-                remote_hostname, _ = remote_addr
-                response_addr = (remote_hostname, self._response_port)
-                self.send(address=message.address,
-                          params=rv,
-                          remote_addr=response_addr)
-        elif "*" in message.address:
-            regex = message.address.replace("*", "[^/]+")
-            for callback_address, callback in self._callbacks.items():
-                if re.match(regex, callback_address):
+        #--------------------------------------------------------------------------------
+        # Messages to coalesced addresses are deferred, keyed by address and target
+        # object, so that a later write to the same object replaces an earlier one.
+        # Deferred writes are applied before any other message is handled, so that
+        # their ordering relative to other messages is preserved.
+        #--------------------------------------------------------------------------------
+        if message.address in self._coalesced_addresses:
+            try:
+                key = (message.address, tuple(message.params[:-1]))
+                if self._pending_writes.pop(key, None) is not None:
+                    self.writes_coalesced += 1
+                self._pending_writes[key] = (message, remote_addr)
+                return
+            except TypeError:
+                #--------------------------------------------------------------------------------
+                # Params that can't be used as a key (e.g. arrays) are handled immediately.
+                #--------------------------------------------------------------------------------
+                pass
+        if self._pending_writes:
+            self.apply_pending_writes()
+        self._process_message(message, remote_addr)
+
+    def apply_pending_writes(self) -> None:
+        """
+        Handle the messages deferred for coalesced addresses.
+        """
+        pending_writes, self._pending_writes = self._pending_writes, {}
+        for message, remote_addr in pending_writes.values():
+            self._process_message(message, remote_addr)
+
+    def _process_message(self, message, remote_addr):
+        #--------------------------------------------------------------------------------
+        # Each message is handled within its own error boundary, so that an exception
+        # in one handler does not prevent the rest of the queued messages from being
+        # processed in this tick.
+        #--------------------------------------------------------------------------------
+        self.messages_handled += 1
+        try:
+            if message.address == CALL_ADDRESS:
+                self._process_call(message.params, remote_addr)
+            elif message.address in self._callbacks:
+                callback = self._callbacks[message.address]
+                if self.stats_enabled:
+                    rv = self._call_timed(message.address, callback, message.params)
+                else:
+                    rv = callback(message.params)
+
+                if rv is not None:
+                    assert isinstance(rv, tuple)
+                    response_addr = self._reply_addr(remote_addr)
+                    self.send(address=message.address,
+                              params=rv,
+                              remote_addr=response_addr)
+            elif is_address_pattern(message.address):
+                for callback_address, callback in self._router.resolve(message.address):
                     try:
-                        rv = callback(message.params)
+                        if self.stats_enabled:
+                            rv = self._call_timed(callback_address, callback, message.params)
+                        else:
+                            rv = callback(message.params)
                     except ValueError:
                         #--------------------------------------------------------------------------------
                         # Don't throw errors for queries that require more arguments
@@ -116,17 +667,86 @@ class OSCServer:
                         continue
                     if rv is not None:
                         assert isinstance(rv, tuple)
-                        remote_hostname, _ = remote_addr
-                        response_addr = (remote_hostname, self._response_port)
+                        response_addr = self._reply_addr(remote_addr)
                         self.send(address=callback_address,
                                   params=rv,
                                   remote_addr=response_addr)
+            else:
+                self.logger.error("AbletonOSC: Unknown OSC address: %s" % message.address)
+        except Exception as e:
+            if message.address == CALL_ADDRESS or message.address in self._callbacks:
+                self.error_counts[message.address] += 1
+            else:
+                self.error_counts[PATTERN_ERROR_KEY] += 1
+            self.logger.error("AbletonOSC: Error handling OSC message: %s" % e)
+            self.logger.warning("AbletonOSC: %s" % traceback.format_exc())
+
+    def _call_timed(self, address: str, callback: Callable, params: List) -> Any:
+        """
+        Call a handler, recording its duration and whether it raised in handler_stats.
+        """
+        start = time.perf_counter()
+        try:
+            rv = callback(params)
+        except Exception:
+            self.handler_stats.record(address, time.perf_counter() - start, error=True)
+            raise
+        self.handler_stats.record(address, time.perf_counter() - start)
+        return rv
+
+    def _process_call(self, params: List, remote_addr) -> None:
+        if len(params) < 2:
+            raise ValueError("%s requires a request ID and an address" % CALL_ADDRESS)
+        request_id, address = params[0], params[1]
+        response_addr = self._reply_addr(remote_addr)
+
+        #--------------------------------------------------------------------------------
+        # A repeated request ID is a retransmission from a client that didn't receive
+        # the ack, so the original response is resent rather than handling it again.
+        #--------------------------------------------------------------------------------
+        window = self._call_windows.setdefault(response_addr, collections.OrderedDict())
+        if request_id in window:
+            self.calls_duplicated += 1
+            self.send(*window[request_id], remote_addr=response_addr)
+            return
+
+        if address in self._callbacks:
+            try:
+                callback = self._callbacks[address]
+                if self.stats_enabled:
+                    rv = self._call_timed(address, callback, list(params[2:]))
+                else:
+                    rv = callback(list(params[2:]))
+                if rv is not None:
+                    assert isinstance(rv, tuple)
+                    self.send(address=address, params=rv, remote_addr=response_addr)
+                response = (ACK_ADDRESS, (request_id,))
+            except Exception as e:
+                self.error_counts[address] += 1
+                self.logger.error("AbletonOSC: Error handling OSC message: %s" % e)
+                self.logger.warning("AbletonOSC: %s" % traceback.format_exc())
+                response = (NACK_ADDRESS, (request_id, str(e)))
         else:
-            self.logger.error("AbletonOSC: Unknown OSC address: %s" % message.address)
+            response = (NACK_ADDRESS, (request_id, "Unknown OSC address: %s" % address))
+
+        window[request_id] = response
+        if len(window) > self.call_window_size:
+            window.popitem(last=False)
+        self.send(*response, remote_addr=response_addr)
 
     def process_bundle(self, bundle, remote_addr):
+        #--------------------------------------------------------------------------------
+        # Bundles with a time tag in the future are held until they are due.
+        #--------------------------------------------------------------------------------
+        if bundle.timestamp != osc_types.IMMEDIATELY and bundle.timestamp > time.time():
+            self.schedule_bundle(bundle, remote_addr)
+            return
+
+        #--------------------------------------------------------------------------------
+        # Messages within the bundle are isolated from one another by process_message.
+        #--------------------------------------------------------------------------------
         for i in bundle:
-            if OscBundle.dgram_is_bundle(i.dgram):
+            if isinstance(i, OscBundle):
                 self.process_bundle(i, remote_addr)
             else:
                 self.process_message(i, remote_addr)
@@ -145,50 +765,382 @@ class OSCServer:
             except ParseError:
                 self.logger.error("AbletonOSC: Error parsing OSC message: %s" % (traceback.format_exc()))
 
-    def process(self) -> None:
+    def schedule_bundle(self, bundle: OscBundle, remote_addr) -> None:
         """
-        Synchronously process all data queued on the OSC socket.
+        Hold a bundle until the first call to process() at or after its time tag.
+        If max_scheduled_bundles are already held, the bundle is discarded.
         """
-        try:
-            repeats = 0
-            while True:
-                #--------------------------------------------------------------------------------
-                # Loop until no more data is available.
-                #--------------------------------------------------------------------------------
-                data, remote_addr = self._socket.recvfrom(65536)
-                #--------------------------------------------------------------------------------
-                # Update the default reply address to the most recent client. Used when
-                # sending (e.g) /live/song/beat messages and listen updates.
-                #
-                # This is slightly ugly and prevents registering listeners from different IPs.
-                #--------------------------------------------------------------------------------
-                self._remote_addr = (remote_addr[0], OSC_RESPONSE_PORT)
-                self.parse_bundle(data, remote_addr)
+        if len(self._scheduled_bundles) >= self.max_scheduled_bundles:
+            self.scheduled_bundles_dropped += 1
+            self.logger.warning("AbletonOSC: Too many scheduled bundles, discarding bundle from %s" % str(remote_addr))
+            return
 
-        except socket.error as e:
-            if e.errno == errno.ECONNRESET:
-                #--------------------------------------------------------------------------------
-                # This benign error seems to occur on startup on Windows
-                #--------------------------------------------------------------------------------
-                self.logger.warning("AbletonOSC: Non-fatal socket error: %s" % (traceback.format_exc()))
-            elif e.errno == errno.EAGAIN or e.errno == errno.EWOULDBLOCK:
-                #--------------------------------------------------------------------------------
-                # Another benign networking error, throw when no data is received
-                # on a call to recvfrom() on a non-blocking socket
-                #--------------------------------------------------------------------------------
-                pass
-            else:
-                #--------------------------------------------------------------------------------
-                # Something more serious has happened
-                #--------------------------------------------------------------------------------
-                self.logger.error("AbletonOSC: Socket error: %s" % (traceback.format_exc()))
+        #--------------------------------------------------------------------------------
+        # The bundle may reference the shared receive buffer, so is parsed again from
+        # a copy of its data. The counter breaks ties between bundles with the same
+        # time tag, so that they are handled in the order they were received.
+        #--------------------------------------------------------------------------------
+        bundle = OscBundle(bytes(bundle.dgram))
+        self._scheduled_count += 1
+        heapq.heappush(self._scheduled_bundles, (bundle.timestamp, self._scheduled_count, bundle, remote_addr))
+
+    def process_scheduled_bundles(self) -> None:
+        """
+        Handle any scheduled bundles whose time tag has passed.
+        """
+        now = time.time()
+        while self._scheduled_bundles and self._scheduled_bundles[0][0] <= now:
+            _, _, bundle, remote_addr = heapq.heappop(self._scheduled_bundles)
+            self._remote_addr = self._reply_addr(remote_addr)
+            try:
+                self.process_bundle(bundle, remote_addr)
+            except Exception as e:
+                self.logger.error("AbletonOSC: Error handling OSC message: %s" % e)
+                self.logger.warning("AbletonOSC: %s" % traceback.format_exc())
+
+    @property
+    def remote_addr(self) -> Tuple[str, int]:
+        """
+        The reply address of the client that most recently sent a message.
+        While a message is being handled, this is the address of its sender.
+        """
+        return self._remote_addr
+
+    def receive(self) -> Optional[Tuple[bytes, Tuple[str, int]]]:
+        """
+        Read one datagram from the OSC sockets.
+
+        In zero-copy mode, the datagram is read into a preallocated buffer and returned
+        as a memoryview onto that buffer, which is only valid until the next call.
+
+        Packets received over TCP connections by poll_tcp() are returned first, followed
+        by datagrams from the UDP and Unix sockets, which are read in turn so that a busy
+        UDP client can't starve Unix socket clients (or vice versa).
 
+        Returns:
+            A tuple of (data, remote_addr), or None if no more data is available.
+        """
+        if self._tcp_packets:
+            return self._tcp_packets.popleft()
+        if self._unix_socket is None:
+            return self._receive_from(self._socket)
+
+        if self._read_unix_first:
+            packet = self._receive_from_unix() or self._receive_from(self._socket)
+        else:
+            packet = self._receive_from(self._socket) or self._receive_from_unix()
+        self._read_unix_first = not self._read_unix_first
+        return packet
+
+    def _receive_from_unix(self) -> Optional[Tuple[bytes, str]]:
+        packet = self._receive_from(self._unix_socket)
+        if packet is not None and not packet[1]:
+            #--------------------------------------------------------------------------------
+            # The sender's socket is not bound to a path.
+            #--------------------------------------------------------------------------------
+            packet = (packet[0], "")
+        return packet
+
+    def _receive_from(self, sock: socket.socket) -> Optional[Tuple[bytes, Any]]:
+        while True:
+            try:
+                if self._recv_buffer is None:
+                    data, remote_addr = sock.recvfrom(65536)
+                else:
+                    nbytes, remote_addr = sock.recvfrom_into(self._recv_buffer)
+                    data = self._recv_view[:nbytes]
+                self.rx_packets += 1
+                self.rx_bytes += len(data)
+                return data, remote_addr
+            except socket.error as e:
+                if e.errno == errno.ECONNRESET:
+                    #--------------------------------------------------------------------------------
+                    # This benign error seems to occur on startup on Windows
+                    #--------------------------------------------------------------------------------
+                    self.logger.warning("AbletonOSC: Non-fatal socket error: %s" % (traceback.format_exc()))
+                    continue
+                elif e.errno == errno.EAGAIN or e.errno == errno.EWOULDBLOCK:
+                    #--------------------------------------------------------------------------------
+                    # Another benign networking error, throw when no data is received
+                    # on a call to recvfrom() on a non-blocking socket
+                    #--------------------------------------------------------------------------------
+                    return None
+                else:
+                    #--------------------------------------------------------------------------------
+                    # Something more serious has happened
+                    #--------------------------------------------------------------------------------
+                    self.logger.error("AbletonOSC: Socket error: %s" % (traceback.format_exc()))
+                    return None
+
+    def process_datagram(self, data: bytes, remote_addr: Tuple[str, int]) -> None:
+        #--------------------------------------------------------------------------------
+        # Update the default reply address to the most recent client. Used when
+        # sending (e.g) /live/startup and /live/error messages, and to identify the
+        # client subscribing to listener updates.
+        #--------------------------------------------------------------------------------
+        self._remote_addr = self._reply_addr(remote_addr)
+        self._client_last_seen[self._remote_addr] = time.monotonic()
+        try:
+            self.parse_bundle(data, remote_addr)
         except Exception as e:
             self.logger.error("AbletonOSC: Error handling OSC message: %s" % e)
             self.logger.warning("AbletonOSC: %s" % traceback.format_exc())
 
+    def process(self) -> None:
+        """
+        Synchronously process data queued on the OSC socket, until either no more data
+        is available or the per-tick time budget is exhausted.
+
+        If the time budget runs out, any data remaining on the socket is moved to an
+        in-memory backlog, which is processed first on the next call.
+
+        Bundles scheduled for this tick or earlier are handled first, followed by packets
+        queued by the per-client rate limiter. Deferred writes to coalesced addresses are
+        applied last.
+
+        Replies are buffered until flush() is called, if max_bundle_size is set.
+        """
+        self._batching = True
+        deadline = None
+        if self.time_budget:
+            deadline = time.perf_counter() + self.time_budget
+        self.process_scheduled_bundles()
+        self.poll_tcp(deadline)
+
+        while deadline is None or time.perf_counter() < deadline:
+            packet = self.rate_limiter.next_ready()
+            if packet is None:
+                break
+            self.process_datagram(*packet)
+
+        while True:
+            if deadline is not None and time.perf_counter() >= deadline:
+                self._fill_backlog()
+                if self._backlog:
+                    self.budget_overruns += 1
+                break
+
+            if self._backlog:
+                data, remote_addr = self._backlog.popleft()
+            else:
+                packet = self.receive()
+                if packet is None:
+                    break
+                data, remote_addr = packet
+            if self.rate_limiter.enabled and not self.rate_limiter.admit(remote_addr):
+                self.rate_limiter.defer(remote_addr, data)
+                continue
+            self.process_datagram(data, remote_addr)
+
+        self.apply_pending_writes()
+        self.rate_limiter.prune()
+
+    def _fill_backlog(self) -> None:
+        #--------------------------------------------------------------------------------
+        # Drain the socket so that a burst does not overflow the kernel's receive
+        # buffer while it waits for the next tick. Once the backlog is full, reading
+        # stops, leaving any further datagrams in the kernel's buffer, so that the time
+        # spent here is bounded by the backlog size even under a sustained flood.
+        #--------------------------------------------------------------------------------
+        while len(self._backlog) < self._backlog.maxlen:
+            packet = self.receive()
+            if packet is None:
+                return
+            data, remote_addr = packet
+            self._backlog.append((bytes(data), remote_addr))
+        self.backlog_full += 1
+
+    def poll_tcp(self, deadline: Optional[float] = None) -> None:
+        """
+        Accept any pending TCP connections, read complete packets from each connection
+        into the queue consumed by receive(), and send any replies that are still pending.
+
+        Reading stops once the queue holds as many packets as the backlog, or the deadline
+        (a time.perf_counter() value) has passed, leaving further data in the kernel's buffers.
+        """
+        if self._tcp_socket is None:
+            return
+
+        while True:
+            try:
+                sock, peer_addr = self._tcp_socket.accept()
+            except socket.error:
+                break
+            if len(self._tcp_connections) >= self.max_tcp_connections:
+                self.logger.warning("AbletonOSC: Too many TCP connections, refusing connection from %s" % str(peer_addr))
+                sock.close()
+                continue
+            connection = TCPConnection(sock, peer_addr)
+            self.logger.info("AbletonOSC: Accepted TCP connection from %s" % str(peer_addr))
+            self._tcp_connections.append(connection)
+
+        #--------------------------------------------------------------------------------
+        # The connection read first is rotated on each call, so that a flooding
+        # connection can't prevent the others from being read.
+        #--------------------------------------------------------------------------------
+        if len(self._tcp_connections) > 1:
+            self._tcp_connections.append(self._tcp_connections.pop(0))
+        for connection in self._tcp_connections:
+            connection.flush()
+            if len(self._tcp_packets) >= self._backlog.maxlen:
+                continue
+            if deadline is not None and time.perf_counter() >= deadline:
+                continue
+            for packet in connection.receive():
+                self._tcp_packets.append((packet, connection))
+                self.rx_packets += 1
+                self.rx_bytes += len(packet)
+
+        if any(connection.closed for connection in self._tcp_connections):
+            for connection in self._tcp_connections:
+                if connection.closed:
+                    self.logger.info("AbletonOSC: Closed TCP connection from %s" % str(connection.peer_addr))
+                    self._closed_clients.append(connection)
+            self._tcp_connections = [connection for connection in self._tcp_connections if not connection.closed]
+
+    def pop_closed_clients(self) -> List[TCPConnection]:
+        """
+        Returns the TCP connections that have closed, and forgets the server's per-client
+        state for each of them.
+
+        A connection is only returned once all of the packets received from it before it
+        closed have been handled, as handling them may add per-client state. Any of its
+        packets held by the rate limiter or scheduled for later are discarded.
+        """
+        if not self._closed_clients:
+            return []
+        pending_clients = set(remote_addr for _, remote_addr in self._tcp_packets)
+        pending_clients.update(remote_addr for _, remote_addr in self._backlog)
+        closed_clients = [client for client in self._closed_clients if client not in pending_clients]
+        self._closed_clients = [client for client in self._closed_clients if client in pending_clients]
+        if closed_clients:
+            scheduled_count = len(self._scheduled_bundles)
+            self._scheduled_bundles = [entry for entry in self._scheduled_bundles if entry[3] not in closed_clients]
+            if len(self._scheduled_bundles) < scheduled_count:
+                heapq.heapify(self._scheduled_bundles)
+            for client in closed_clients:
+                self.rate_limiter.forget(client)
+                self._forget_client(client)
+        return closed_clients
+
+    def pop_expired_clients(self, lease_duration: float) -> List[Any]:
+        """
+        Returns the reply addresses of clients that have sent nothing for lease_duration
+        seconds, and forgets the server's per-client state for each of them.
+        """
+        expiry_time = time.monotonic() - lease_duration
+        expired_clients = [client for client, last_seen in self._client_last_seen.items() if last_seen < expiry_time]
+        for client in expired_clients:
+            self._forget_client(client)
+            self.leases_expired += 1
+        return expired_clients
+
+    def _forget_client(self, client) -> None:
+        self._client_last_seen.pop(client, None)
+        self._sequence_numbers.pop(client, None)
+        self._multicast_clients.discard(client)
+        self._call_windows.pop(client, None)
+        self._send_backlogs.pop(client, None)
+
+    def set_socket_buffer_sizes(self, recv_buffer_size: Optional[int], send_buffer_size: Optional[int]) -> None:
+        """
+        Set the kernel receive and send buffer sizes of the UDP and Unix sockets, in bytes.
+        Sizes that are None or zero are left unchanged. The kernel may round or cap the sizes
+        (on Linux, to net.core.rmem_max and net.core.wmem_max); see get_net_stats() for the actual sizes.
+        """
+        for sock in (self._socket, self._unix_socket):
+            if sock is None:
+                continue
+            if recv_buffer_size:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, recv_buffer_size)
+            if send_buffer_size:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, send_buffer_size)
+
+    def get_net_stats(self) -> Dict[str, Any]:
+        """
+        Returns a dict of network counters and socket buffer sizes. The kernel's receive queue
+        length and drop count for the UDP socket are only available on Linux, and are -1 elsewhere.
+        """
+        kernel_rx_queue, kernel_drops = self._get_kernel_udp_stats()
+        return {
+            "rx_packets": self.rx_packets,
+            "rx_bytes": self.rx_bytes,
+            "tx_packets": self.tx_packets,
+            "tx_bytes": self.tx_bytes,
+            "tx_eagain": self.tx_eagain,
+            "recv_buffer_size": self._socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF),
+            "send_buffer_size": self._socket.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF),
+            "kernel_rx_queue": kernel_rx_queue,
+            "kernel_drops": kernel_drops,
+        }
+
+    def _get_kernel_udp_stats(self) -> Tuple[int, int]:
+        #--------------------------------------------------------------------------------
+        # On Linux, /proc/net/udp lists each UDP socket's receive queue length (in
+        # bytes) and the number of datagrams dropped because the queue was full.
+        # The socket is identified by its inode.
+        #--------------------------------------------------------------------------------
+        try:
+            inode = str(os.fstat(self._socket.fileno()).st_ino)
+            with open("/proc/net/udp") as fd:
+                for line in fd.readlines()[1:]:
+                    fields = line.split()
+                    if fields[9] == inode:
+                        return int(fields[4].split(":")[1], 16), int(fields[-1])
+        except (OSError, IndexError, ValueError):
+            pass
+        return -1, -1
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Returns a dict of counters describing the server's current state.
+        """
+        return {
+            "messages_handled": self.messages_handled,
+            "backlog_depth": len(self._backlog),
+            "backlog_full": self.backlog_full,
+            "budget_overruns": self.budget_overruns,
+            "bundles_sent": self.bundles_sent,
+            "tcp_connections": len(self._tcp_connections),
+            "fragmented_packets": self.fragmented_packets,
+            "scheduled_bundles": len(self._scheduled_bundles),
+            "scheduled_bundles_dropped": self.scheduled_bundles_dropped,
+            "writes_coalesced": self.writes_coalesced,
+            "packets_throttled": self.rate_limiter.throttled_total,
+            "packets_dropped": self.rate_limiter.dropped_total,
+            "throttle_queue_depth": self.rate_limiter.queued,
+            "updates_coalesced": self.updates_coalesced,
+            "updates_dropped": self.updates_dropped,
+            "calls_duplicated": self.calls_duplicated,
+            "leases_expired": self.leases_expired,
+            "sends_deferred": self.sends_deferred,
+            "send_backlog_depth": sum(len(backlog) for backlog in self._send_backlogs.values()),
+            "send_backlog_dropped": self.send_backlog_dropped,
+        }
+
+    def get_memory_stats(self) -> Dict[str, int]:
+        """
+        Returns the number of entries held in the server's caches and per-client state.
+        """
+        return {
+            "router_cache": self._router.cached_patterns,
+            "encoder_cache": self._encoder.cached_entries,
+            "call_windows": sum(len(window) for window in self._call_windows.values()),
+            "client_leases": len(self._client_last_seen),
+            "sequenced_clients": len(self._sequence_numbers),
+            "handler_stats": len(self.handler_stats),
+        }
+
     def shutdown(self) -> None:
         """
         Shutdown the server network sockets.
         """
         self._socket.close()
+        if self._tcp_socket is not None:
+            self._tcp_socket.close()
+        for connection in self._tcp_connections:
+            connection.close()
+        if self._unix_socket is not None:
+            self._unix_socket.close()
+            if os.path.exists(self._unix_path):
+                os.unlink(self._unix_path)
@@ -0,0 +1,70 @@
+import os
+import time
+import pstats
+import cProfile
+from typing import List, Optional
+
+from .constants import OSC_PROFILE_TOP_FUNCTIONS
+
+class TickProfiler:
+    def __init__(self, ticks: Optional[int] = None, seconds: Optional[float] = None):
+        """
+        Profiles the processing within each tick with cProfile, until the given number
+        of ticks or seconds has elapsed, or stop() is called.
+
+        Args:
+            ticks: If set, the number of ticks to profile.
+            seconds: If set, the number of seconds to profile for.
+        """
+        self.ticks = ticks
+        self.seconds = seconds
+        self.ticks_profiled = 0
+        self._start_time = time.monotonic()
+        self._profile = cProfile.Profile()
+
+    @property
+    def finished(self) -> bool:
+        if self.ticks is not None and self.ticks_profiled >= self.ticks:
+            return True
+        if self.seconds is not None and time.monotonic() - self._start_time >= self.seconds:
+            return True
+        return False
+
+    def start_tick(self) -> None:
+        self._profile.enable()
+
+    def end_tick(self) -> None:
+        self._profile.disable()
+        self.ticks_profiled += 1
+
+    def stop(self, log_dir: str) -> Optional[str]:
+        """
+        Stop profiling, and write the profile to a .pstats file in log_dir, which can be
+        inspected with the pstats module or a viewer such as snakeviz.
+
+        Returns:
+            The path of the .pstats file, or None if nothing was profiled (e.g. profiling
+            was stopped within the tick that it was started), in which case no file is written.
+        """
+        self._profile.disable()
+        self._profile.create_stats()
+        if not self._profile.stats:
+            return None
+        filename = "profile-%s.pstats" % time.strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(log_dir, filename)
+        self._profile.dump_stats(path)
+        return path
+
+    def get_top_functions(self, count: int = OSC_PROFILE_TOP_FUNCTIONS) -> List:
+        """
+        Returns a flat list describing the functions with the greatest cumulative time:
+        for each, its location as file:line(name), number of calls, and cumulative time
+        in milliseconds.
+        """
+        if not self._profile.stats:
+            return []
+        stats = pstats.Stats(self._profile).stats
+        top_functions = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:count]
+        return [value
+                for (path, line, name), (_, call_count, _, cumulative_time, _) in top_functions
+                for value in ("%s:%d(%s)" % (os.path.basename(path), line, name), call_count, cumulative_time * 1000.0)]
@@ -0,0 +1,123 @@
+import time
+import collections
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+class ClientRateLimiter:
+    def __init__(self, rate: float = 0, burst: int = 100, queue_size: int = 1000, max_tracked_clients: int = 256):
+        """
+        Limits the rate at which packets from each client are handled, using a token bucket
+        per client, so that a client flooding the server cannot starve the others.
+
+        Packets from a client that has run out of tokens are queued, and queued packets
+        are released in round-robin order between clients as their tokens are replenished.
+
+        Args:
+            rate: Number of packets per second that each client may send. If zero, no limit is applied.
+            burst: Number of packets that a client may send in a burst above the rate.
+            queue_size: Maximum number of packets queued per client. When a client's queue
+                        is full, its oldest packets are discarded.
+            max_tracked_clients: Maximum number of clients for which throttled and dropped
+                                 packet counts are kept. When exceeded, the counts of the
+                                 client that was first throttled longest ago are discarded.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.queue_size = queue_size
+        self._buckets: Dict[Hashable, list] = {}
+        self._queues: collections.OrderedDict = collections.OrderedDict()
+        self.max_tracked_clients = max_tracked_clients
+        self.throttled_counts = collections.Counter()
+        self.dropped_counts = collections.Counter()
+        self.throttled_total = 0
+        self.dropped_total = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    @property
+    def queued(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def admit(self, client: Hashable) -> bool:
+        """
+        Returns True if a packet from the client can be handled now. Packets from a client
+        with packets already queued must be queued behind them, to preserve their order.
+        """
+        if client in self._queues:
+            return False
+        return self._take_token(client)
+
+    def defer(self, client: Hashable, data: bytes) -> None:
+        """
+        Queue a packet from a client that has been refused by admit().
+        """
+        queue = self._queues.get(client)
+        if queue is None:
+            queue = self._queues[client] = collections.deque(maxlen=self.queue_size)
+        if client not in self.throttled_counts and len(self.throttled_counts) >= self.max_tracked_clients:
+            #--------------------------------------------------------------------------------
+            # Clients on short-lived ephemeral ports would otherwise grow the counts without limit.
+            #--------------------------------------------------------------------------------
+            oldest_client = next(iter(self.throttled_counts))
+            del self.throttled_counts[oldest_client]
+            self.dropped_counts.pop(oldest_client, None)
+        if len(queue) == queue.maxlen:
+            self.dropped_counts[client] += 1
+            self.dropped_total += 1
+        queue.append(bytes(data))
+        self.throttled_counts[client] += 1
+        self.throttled_total += 1
+
+    def next_ready(self) -> Optional[Tuple[bytes, Any]]:
+        """
+        Returns the next queued (data, client) pair that can now be handled, taking one
+        packet from each client in turn, or None if no client has both packets and tokens.
+        If the limit has been disabled, queued packets are released without tokens.
+        """
+        for client in list(self._queues.keys()):
+            if self.enabled and not self._take_token(client):
+                continue
+            queue = self._queues.pop(client)
+            data = queue.popleft()
+            if queue:
+                #--------------------------------------------------------------------------------
+                # Re-inserting the queue moves the client to the back of the round-robin order.
+                #--------------------------------------------------------------------------------
+                self._queues[client] = queue
+            return data, client
+        return None
+
+    def prune(self) -> None:
+        """
+        Forget the buckets of clients with no queued packets whose buckets have refilled,
+        so that state isn't retained for clients that have gone away.
+        """
+        if not self.rate:
+            self._buckets.clear()
+            return
+        now = time.perf_counter()
+        refill_time = self.burst / self.rate
+        for client in [client for client, (_, timestamp) in self._buckets.items()
+                       if client not in self._queues and now - timestamp > refill_time]:
+            del self._buckets[client]
+
+    def forget(self, client: Hashable) -> None:
+        """
+        Discard a client's bucket and queued packets, e.g. when it has disconnected.
+        """
+        self._buckets.pop(client, None)
+        self._queues.pop(client, None)
+
+    def _take_token(self, client: Hashable) -> bool:
+        now = time.perf_counter()
+        bucket = self._buckets.get(client)
+        if bucket is None:
+            bucket = self._buckets[client] = [self.burst, now]
+        tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+        bucket[1] = now
+        if tokens >= 1:
+            bucket[0] = tokens - 1
+            return True
+        bucket[0] = tokens
+        return False
@@ -0,0 +1,143 @@
+import re
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+#--------------------------------------------------------------------------------
+# Characters with special meaning in an OSC 1.0 address pattern.
+#--------------------------------------------------------------------------------
+PATTERN_CHARACTERS = "*?[]{}"
+
+def is_address_pattern(address: str) -> bool:
+    return any(character in address for character in PATTERN_CHARACTERS)
+
+def compile_segment_pattern(segment: str) -> re.Pattern:
+    """
+    Translate one segment of an OSC 1.0 address pattern into a regular expression.
+
+     - ? matches any single character
+     - * matches any sequence of zero or more characters
+     - [abc], [a-z] match any character in the set; [!a-z] negates the set
+     - {foo,bar} matches any of the comma-separated strings
+
+    Raises:
+        ValueError: If the pattern is malformed (e.g. an unterminated or empty set).
+    """
+    regex = ""
+    index = 0
+    while index < len(segment):
+        character = segment[index]
+        if character == "?":
+            regex += "."
+        elif character == "*":
+            regex += ".*"
+        elif character == "[":
+            end = segment.find("]", index + 1)
+            if end == -1:
+                raise ValueError("Unterminated [ in OSC address pattern: %s" % segment)
+            members = segment[index + 1:end]
+            negate = members.startswith("!")
+            if negate:
+                members = members[1:]
+            members = "".join("-" if member == "-" else re.escape(member) for member in members)
+            regex += "[%s%s]" % ("^" if negate else "", members)
+            index = end
+        elif character == "{":
+            end = segment.find("}", index + 1)
+            if end == -1:
+                raise ValueError("Unterminated { in OSC address pattern: %s" % segment)
+            options = segment[index + 1:end].split(",")
+            regex += "(?:%s)" % "|".join(re.escape(option) for option in options)
+            index = end
+        else:
+            regex += re.escape(character)
+        index += 1
+    try:
+        return re.compile(regex)
+    except re.error as e:
+        #--------------------------------------------------------------------------------
+        # e.g. an empty set [] or a reversed range [z-a]
+        #--------------------------------------------------------------------------------
+        raise ValueError("Invalid OSC address pattern: %s (%s)" % (segment, e))
+
+class _RouteNode:
+    __slots__ = ("children", "address", "handler")
+
+    def __init__(self):
+        self.children: Dict[str, "_RouteNode"] = {}
+        self.address: Optional[str] = None
+        self.handler: Optional[Callable] = None
+
+class OSCRouter:
+    def __init__(self, cache_size: int = 256):
+        """
+        Index of OSC handlers, used to resolve OSC address patterns.
+
+        Handlers are stored in a trie keyed by address segment, so that resolving
+        a pattern such as /live/track/get/* only visits the branches that can
+        match, rather than testing every registered address in turn.
+        Matching is anchored at both ends: /live/device/get/* matches
+        /live/device/get/name but not /live/device/get/parameters/name.
+
+        Resolved patterns are kept in a bounded LRU cache, so that a repeated
+        query costs a single dictionary lookup. The cache is invalidated whenever
+        the set of handlers changes.
+
+        Args:
+            cache_size: Maximum number of resolved patterns to cache.
+        """
+        self._root = _RouteNode()
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_size = cache_size
+
+    def add(self, address: str, handler: Callable) -> None:
+        node = self._root
+        for segment in address.split("/")[1:]:
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _RouteNode()
+            node = child
+        node.address = address
+        node.handler = handler
+        self._cache.clear()
+
+    def clear(self) -> None:
+        self._root = _RouteNode()
+        self._cache.clear()
+
+    @property
+    def cached_patterns(self) -> int:
+        return len(self._cache)
+
+    def resolve(self, pattern: str) -> List[Tuple[str, Callable]]:
+        """
+        Returns the (address, handler) pairs matching the given OSC address pattern,
+        in the order that they were registered.
+
+        Raises:
+            ValueError: If the pattern is malformed.
+        """
+        matches = self._cache.get(pattern)
+        if matches is not None:
+            self._cache.move_to_end(pattern)
+            return matches
+
+        matches = self._resolve(pattern)
+        self._cache[pattern] = matches
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return matches
+
+    def _resolve(self, pattern: str) -> List[Tuple[str, Callable]]:
+        nodes = [self._root]
+        for segment in pattern.split("/")[1:]:
+            if is_address_pattern(segment):
+                regex = compile_segment_pattern(segment)
+                nodes = [child
+                         for node in nodes
+                         for name, child in node.children.items()
+                         if regex.fullmatch(name)]
+            else:
+                nodes = [node.children[segment] for node in nodes if segment in node.children]
+            if not nodes:
+                return []
+        return [(node.address, node.handler) for node in nodes if node.handler is not None]
@@ -267,34 +267,26 @@ class SongHandler(AbletonOSCHandler):
         # Listener for /live/song/get/beat
         #--------------------------------------------------------------------------------
         self.last_song_time = -1.0
-        
+
+        def get_beat_messages():
+            #--------------------------------------------------------------------------------
+            # If song has rewound or skipped to next beat, sent a /live/beat message
+            #--------------------------------------------------------------------------------
+            messages = []
+            if (self.song.current_song_time < self.last_song_time) or \
+                    (int(self.song.current_song_time) > int(self.last_song_time)):
+                messages.append(("/live/song/get/beat", (int(self.song.current_song_time),)))
+            self.last_song_time = self.song.current_song_time
+            return messages
+
         def stop_beat_listener(params: Tuple[Any] = ()):
-            try:
-                self.song.remove_current_song_time_listener(self.current_song_time_changed)
-                self.logger.info("Removing beat listener")
-            except:
-                pass
+            self._remove_listener(("beat", ()), self.osc_server.remote_addr)
 
         def start_beat_listener(params: Tuple[Any] = ()):
-            stop_beat_listener()
             self.logger.info("Adding beat listener")
-            self.song.add_current_song_time_listener(self.current_song_time_changed)
+            self._add_listener(("beat", ()), get_beat_messages,
+                               self.song.add_current_song_time_listener,
+                               self.song.remove_current_song_time_listener)
 
         self.osc_server.add_handler("/live/song/start_listen/beat", start_beat_listener)
         self.osc_server.add_handler("/live/song/stop_listen/beat", stop_beat_listener)
-
-    def current_song_time_changed(self):
-        #--------------------------------------------------------------------------------
-        # If song has rewound or skipped to next beat, sent a /live/beat message
-        #--------------------------------------------------------------------------------
-        if (self.song.current_song_time < self.last_song_time) or \
-                (int(self.song.current_song_time) > int(self.last_song_time)):
-            self.osc_server.send("/live/song/get/beat", (int(self.song.current_song_time),))
-        self.last_song_time = self.song.current_song_time
-
-    def clear_api(self):
-        super().clear_api()
-        try:
-            self.song.remove_current_song_time_listener(self.current_song_time_changed)
-        except:
-            pass
@@ -0,0 +1,64 @@
+import bisect
+from typing import Dict, Iterator, List, Tuple
+
+#--------------------------------------------------------------------------------
+# Upper bounds of the handler latency histogram buckets, in seconds.
+# The final bucket counts calls that took longer than the last bound.
+#--------------------------------------------------------------------------------
+LATENCY_BUCKETS = (0.0001, 0.001, 0.01, 0.1)
+
+class AddressStats:
+    __slots__ = ("calls", "errors", "total_time", "max_time", "histogram")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def record(self, duration: float, error: bool = False) -> None:
+        self.calls += 1
+        if error:
+            self.errors += 1
+        self.total_time += duration
+        if duration > self.max_time:
+            self.max_time = duration
+        self.histogram[bisect.bisect_left(LATENCY_BUCKETS, duration)] += 1
+
+class HandlerStats:
+    def __init__(self):
+        """
+        Records the number of calls, number of errors, total and maximum time and a
+        latency histogram for the handler of each OSC address.
+        """
+        self._stats: Dict[str, AddressStats] = {}
+
+    def record(self, address: str, duration: float, error: bool = False) -> None:
+        stats = self._stats.get(address)
+        if stats is None:
+            stats = self._stats[address] = AddressStats()
+        stats.record(duration, error)
+
+    def reset(self) -> None:
+        self._stats = {}
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    def items(self) -> Iterator[Tuple[str, AddressStats]]:
+        """
+        Returns (address, stats) pairs, ordered by total time, most expensive first.
+        """
+        return iter(sorted(self._stats.items(), key=lambda item: item[1].total_time, reverse=True))
+
+    def flatten(self) -> List:
+        """
+        Returns the stats as a flat list, with a group of values for each address:
+        address, calls, errors, total_ms, max_ms, followed by the histogram bucket counts.
+        """
+        return [value
+                for address, stats in self.items()
+                for value in (address, stats.calls, stats.errors,
+                              stats.total_time * 1000.0, stats.max_time * 1000.0,
+                              *stats.histogram)]
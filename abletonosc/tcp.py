@@ -0,0 +1,117 @@
+import errno
+import socket
+import logging
+from typing import List, Tuple
+
+#--------------------------------------------------------------------------------
+# SLIP framing (RFC 1055), as used for OSC over stream transports in OSC 1.1.
+# Each packet is preceded and followed by an END byte, and occurrences of
+# END and ESC within the packet are escaped.
+#--------------------------------------------------------------------------------
+SLIP_END = b"\xc0"
+SLIP_ESC = b"\xdb"
+SLIP_ESC_END = b"\xdb\xdc"
+SLIP_ESC_ESC = b"\xdb\xdd"
+
+#--------------------------------------------------------------------------------
+# Maximum number of bytes buffered per connection in each direction. A client
+# that exceeds these limits is disconnected.
+#--------------------------------------------------------------------------------
+TCP_MAX_RECV_BUFFER = 1 << 20
+TCP_MAX_SEND_BUFFER = 16 << 20
+
+#--------------------------------------------------------------------------------
+# Maximum number of bytes read from a connection by each call to receive().
+# Any further data is left in the kernel's buffer until the next call.
+#--------------------------------------------------------------------------------
+TCP_MAX_READ_SIZE = 64 << 10
+
+def slip_encode(packet: bytes) -> bytes:
+    return SLIP_END + packet.replace(SLIP_ESC, SLIP_ESC_ESC).replace(SLIP_END, SLIP_ESC_END) + SLIP_END
+
+def slip_decode(buffer: bytearray) -> List[bytes]:
+    """
+    Extract all complete packets from a buffer of SLIP-encoded data.
+    The packets are removed from the buffer, leaving any partial packet in place.
+    """
+    end = buffer.rfind(SLIP_END)
+    if end == -1:
+        return []
+    frames = bytes(buffer[:end]).split(SLIP_END)
+    del buffer[:end + 1]
+    return [frame.replace(SLIP_ESC_END, SLIP_END).replace(SLIP_ESC_ESC, SLIP_ESC)
+            for frame in frames if frame]
+
+class TCPConnection:
+    def __init__(self, sock: socket.socket, peer_addr: Tuple[str, int]):
+        """
+        A client connected to the OSC server over TCP, exchanging SLIP-framed OSC packets.
+
+        Used as the reply address for messages received over the connection, so that
+        replies and listener updates are sent back over the same connection.
+        """
+        self.peer_addr = peer_addr
+        self.closed = False
+        self._socket = sock
+        self._socket.setblocking(False)
+        self._recv_buffer = bytearray()
+        self._send_buffer = bytearray()
+        self.logger = logging.getLogger("abletonosc")
+
+    def __repr__(self):
+        return "tcp:%s:%d" % self.peer_addr
+
+    def receive(self, max_size: int = TCP_MAX_READ_SIZE) -> List[bytes]:
+        """
+        Read the available data from the connection, up to about max_size bytes.
+
+        Returns:
+            A list of the complete OSC packets received.
+        """
+        packets = []
+        size = 0
+        while not self.closed and size < max_size:
+            try:
+                data = self._socket.recv(65536)
+            except socket.error as e:
+                if e.errno not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    self.close()
+                break
+            if not data:
+                self.close()
+                break
+            size += len(data)
+            self._recv_buffer += data
+            packets += slip_decode(self._recv_buffer)
+            if len(self._recv_buffer) > TCP_MAX_RECV_BUFFER:
+                self.logger.warning("AbletonOSC: TCP client %s exceeded maximum packet size, disconnecting" % self)
+                self.close()
+        return packets
+
+    def send(self, packet: bytes) -> None:
+        """
+        Queue an OSC packet to send, and send as much queued data as the socket will accept.
+        """
+        if self.closed:
+            return
+        self._send_buffer += slip_encode(packet)
+        if len(self._send_buffer) > TCP_MAX_SEND_BUFFER:
+            self.logger.warning("AbletonOSC: TCP client %s is not reading replies, disconnecting" % self)
+            self.close()
+            return
+        self.flush()
+
+    def flush(self) -> None:
+        while self._send_buffer and not self.closed:
+            try:
+                sent = self._socket.send(self._send_buffer)
+            except socket.error as e:
+                if e.errno not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    self.close()
+                break
+            del self._send_buffer[:sent]
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self._socket.close()
@@ -0,0 +1,71 @@
+import time
+import collections
+from typing import List, Optional
+
+from .constants import OSC_TICK_MONITOR_SIZE
+
+#--------------------------------------------------------------------------------
+# Manager.tick is rescheduled every 100ms, so this is the expected time between
+# the starts of consecutive ticks.
+#--------------------------------------------------------------------------------
+TICK_INTERVAL = 0.1
+
+TICK_PERCENTILES = (50, 90, 99)
+
+class TickMonitor:
+    def __init__(self, size: int = OSC_TICK_MONITOR_SIZE, interval: float = TICK_INTERVAL):
+        """
+        Records how late each tick starts relative to the previous tick, how long it takes,
+        and how many OSC messages are handled within it, over the most recent ticks.
+
+        Args:
+            size: Number of ticks to retain.
+            interval: Expected time between the starts of consecutive ticks, in seconds.
+        """
+        self.interval = interval
+        self.ticks = 0
+        self._jitters = collections.deque(maxlen=size)
+        self._durations = collections.deque(maxlen=size)
+        self._message_counts = collections.deque(maxlen=size)
+        self._tick_start: Optional[float] = None
+
+    def start_tick(self) -> None:
+        now = time.perf_counter()
+        if self._tick_start is not None:
+            self._jitters.append(now - self._tick_start - self.interval)
+        self._tick_start = now
+
+    def end_tick(self, message_count: int) -> None:
+        self._durations.append(time.perf_counter() - self._tick_start)
+        self._message_counts.append(message_count)
+        self.ticks += 1
+
+    def reset(self) -> None:
+        self._jitters.clear()
+        self._durations.clear()
+        self._message_counts.clear()
+
+    def get_summary(self) -> List:
+        """
+        Returns a flat list of name/value pairs: the number of ticks recorded, then the
+        percentiles and maximum of the start jitter and duration (in milliseconds) and of
+        the number of messages handled per tick.
+        """
+        summary = ["ticks", len(self._durations)]
+        for name, values, scale in (("jitter_ms", self._jitters, 1000.0),
+                                    ("duration_ms", self._durations, 1000.0),
+                                    ("messages", self._message_counts, 1)):
+            values = sorted(values)
+            for percentile in TICK_PERCENTILES:
+                summary += ["%s_p%d" % (name, percentile), _percentile(values, percentile) * scale]
+            summary += ["%s_max" % name, (values[-1] if values else 0) * scale]
+        return summary
+
+def _percentile(values: List, percentile: int):
+    """
+    Returns the nearest-rank percentile of a sorted list, or 0 if it is empty.
+    """
+    if not values:
+        return 0
+    index = max(0, -(-len(values) * percentile // 100) - 1)
+    return values[index]
@@ -83,7 +83,8 @@ class TrackHandler(AbletonOSCHandler):
             self.osc_server.add_handler("/live/track/get/%s" % prop,
                                         create_track_callback(self._get_mixer_property, prop))
             self.osc_server.add_handler("/live/track/set/%s" % prop,
-                                        create_track_callback(self._set_mixer_property, prop))
+                                        create_track_callback(self._set_mixer_property, prop),
+                                        coalesce=True)
             self.osc_server.add_handler("/live/track/start_listen/%s" % prop,
                                         create_track_callback(self._start_mixer_listen, prop, include_track_id=True))
             self.osc_server.add_handler("/live/track/stop_listen/%s" % prop,
@@ -100,7 +101,7 @@ class TrackHandler(AbletonOSCHandler):
             track.mixer_device.sends[send_id].value = value
 
         self.osc_server.add_handler("/live/track/get/send", create_track_callback(track_get_send))
-        self.osc_server.add_handler("/live/track/set/send", create_track_callback(track_set_send))
+        self.osc_server.add_handler("/live/track/set/send", create_track_callback(track_set_send), coalesce=True)
 
         def track_delete_clip(track, params: Tuple[Any]):
             clip_index, = params
@@ -243,32 +244,18 @@ class TrackHandler(AbletonOSCHandler):
 
     def _start_mixer_listen(self, target, prop, params: Optional[Tuple] = ()) -> None:
         parameter_object = getattr(target.mixer_device, prop)
-        def property_changed_callback():
+        osc_address = "/live/%s/get/%s" % (self.class_identifier, prop)
+        def get_messages():
             value = parameter_object.value
             self.logger.info("Property %s changed of %s %s: %s" % (prop, self.class_identifier, str(params), value))
-            osc_address = "/live/%s/get/%s" % (self.class_identifier, prop)
-            self.osc_server.send(osc_address, (*params, value,))
-
-        listener_key = (prop, tuple(params))
-        if listener_key in self.listener_functions:
-            self._stop_mixer_listen(target, prop, params)
+            return [(osc_address, (*params, value,))]
 
         self.logger.info("Adding listener for %s %s, property: %s" % (self.class_identifier, str(params), prop))
-
-        parameter_object.add_value_listener(property_changed_callback)
-        self.listener_functions[listener_key] = property_changed_callback
-        #--------------------------------------------------------------------------------
-        # Immediately send the current value
-        #--------------------------------------------------------------------------------
-        property_changed_callback()
+        listener_key = (prop, tuple(params))
+        self._add_listener(listener_key, get_messages,
+                           parameter_object.add_value_listener,
+                           parameter_object.remove_value_listener)
 
     def _stop_mixer_listen(self, target, prop, params: Optional[Tuple[Any]] = ()) -> None:
-        parameter_object = getattr(target.mixer_device, prop)
         listener_key = (prop, tuple(params))
-        if listener_key in self.listener_functions:
-            self.logger.info("Removing listener for %s %s, property %s" % (self.class_identifier, str(params), prop))
-            listener_function = self.listener_functions[listener_key]
-            parameter_object.remove_value_listener(listener_function)
-            del self.listener_functions[listener_key]
-        else:
-            self.logger.warning("No listener function found for property: %s (%s)" % (prop, str(params)))
+        self._remove_listener(listener_key, self.osc_server.remote_addr)
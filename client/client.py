@@ -1,7 +1,11 @@
 import argparse
+import random
+import socket
+import struct
 import threading
 from pythonosc.udp_client import SimpleUDPClient, OscBundle, OscMessageBuilder
-from pythonosc.osc_bundle_builder import OscBundleBuilder
+from pythonosc.osc_bundle_builder import OscBundleBuilder, IMMEDIATELY
+from pythonosc.osc_message import OscMessage
 from pythonosc.dispatcher import Dispatcher
 from pythonosc.osc_server import ThreadingOSCUDPServer
 from typing import Callable, Iterable
@@ -15,6 +19,29 @@ LOCAL_PORT = 11001
 #--------------------------------------------------------------------------------
 TICK_DURATION = 0.150
 
+#--------------------------------------------------------------------------------
+# Replies too large for a single datagram are sent as a series of fragments
+# to this address, with params (fragment_id, index, count, blob).
+#--------------------------------------------------------------------------------
+FRAGMENT_ADDRESS = "/live/fragment"
+MAX_PENDING_FRAGMENTS = 64
+
+#--------------------------------------------------------------------------------
+# When sequence numbers are enabled, listener updates are sent to this address,
+# with params (sequence_number, address, *params). Sequence numbers wrap
+# around to 0 after 2**31 - 1.
+#--------------------------------------------------------------------------------
+UPDATE_ADDRESS = "/live/update"
+SEQUENCE_MODULUS = 1 << 31
+
+#--------------------------------------------------------------------------------
+# Acknowledged calls: messages sent to CALL_ADDRESS with params
+# (request_id, address, *params) are answered with an ack or nack.
+#--------------------------------------------------------------------------------
+CALL_ADDRESS = "/live/api/call"
+ACK_ADDRESS = "/live/api/ack"
+NACK_ADDRESS = "/live/api/nack"
+
 class AbletonOSCClient:
     def __init__(self, hostname="127.0.0.1", port=REMOTE_PORT, client_port=LOCAL_PORT):
         """
@@ -31,27 +58,155 @@ class AbletonOSCClient:
         self.server_thread.daemon = True
         self.server_thread.start()
         self.address_handlers = {}
+        #--------------------------------------------------------------------------------
+        # Each datagram is handled on its own thread, so state shared between
+        # datagrams is guarded by a lock.
+        #--------------------------------------------------------------------------------
+        self.fragments = {}
+        self.fragments_lock = threading.Lock()
+        self.sequence_number = None
+        self.sequence_lock = threading.Lock()
+        self.sequence_gaps = 0
+        self.resync_on_gap = False
+        self.pending_calls = {}
+        self.next_request_id = random.randrange(1 << 30)
         self.client = SimpleUDPClient(hostname, port)
         self.verbose = False
 
     def handle_osc(self, address, *params):
         # print("Received OSC: %s %s" % (address, params))
+        if address == FRAGMENT_ADDRESS:
+            self.handle_fragment(*params)
+            return
+        if address == UPDATE_ADDRESS:
+            self.handle_update(*params)
+            return
+        if address in (ACK_ADDRESS, NACK_ADDRESS) and params and params[0] in self.pending_calls:
+            event, response = self.pending_calls[params[0]]
+            response.append((address, params[1:]))
+            event.set()
         if address in self.address_handlers:
             self.address_handlers[address](address, params)
         if self.verbose:
             print(address, params)
 
+    def start_heartbeat(self, interval: float = 1.0):
+        """
+        Send /live/api/heartbeat every `interval` seconds from a background thread, renewing
+        this client's lease on its listeners when AbletonOSC has a lease duration set.
+        """
+        def heartbeat():
+            while not self.heartbeat_stopped.wait(interval):
+                self.send_message("/live/api/heartbeat")
+
+        self.heartbeat_stopped = threading.Event()
+        self.heartbeat_thread = threading.Thread(target=heartbeat)
+        self.heartbeat_thread.daemon = True
+        self.heartbeat_thread.start()
+
+    def stop_heartbeat(self):
+        self.heartbeat_stopped.set()
+        self.heartbeat_thread.join()
+
+    def enable_multicast(self):
+        """
+        Join AbletonOSC's multicast group, and request that listener updates are sent
+        to the group rather than to this client individually.
+
+        Raises:
+            RuntimeError: If AbletonOSC has no multicast group configured.
+        """
+        group, port = self.query("/live/api/get/multicast")
+        if not group:
+            raise RuntimeError("AbletonOSC has no multicast group configured")
+        membership = struct.pack("4s4s", socket.inet_aton(group), socket.inet_aton("0.0.0.0"))
+        self.server.socket.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, membership)
+        self.send_message("/live/api/set/multicast", (1,))
+
+    def enable_sequence_numbers(self, resync_on_gap: bool = True):
+        """
+        Request sequence numbers on listener updates, so that lost updates can be detected.
+
+        Args:
+            resync_on_gap: If True, request the current value of every subscribed property
+                           (via /live/api/resync) whenever a gap in the sequence is detected.
+        """
+        with self.sequence_lock:
+            self.sequence_number = None
+        self.resync_on_gap = resync_on_gap
+        self.send_message("/live/api/set/sequence_numbers", (1,))
+
+    def handle_update(self, sequence_number: int, address: str, *params):
+        #--------------------------------------------------------------------------------
+        # Sequence numbers wrap around at 2**31. An update numbered before the latest
+        # one received was handled out of order, so is not a gap.
+        #--------------------------------------------------------------------------------
+        with self.sequence_lock:
+            gap = False
+            if self.sequence_number is None:
+                self.sequence_number = sequence_number
+            else:
+                step = (sequence_number - self.sequence_number) % SEQUENCE_MODULUS
+                if 0 < step < SEQUENCE_MODULUS // 2:
+                    gap = step != 1
+                    self.sequence_number = sequence_number
+            if gap:
+                self.sequence_gaps += 1
+        if gap and self.resync_on_gap:
+            self.send_message("/live/api/resync")
+        self.handle_osc(address, *params)
+
+    def handle_fragment(self, fragment_id: int, index: int, count: int, data: bytes):
+        """
+        Reassemble a packet that was split into fragments, and handle its contents
+        once all of its fragments have been received.
+        """
+        with self.fragments_lock:
+            if fragment_id not in self.fragments:
+                if len(self.fragments) >= MAX_PENDING_FRAGMENTS:
+                    #--------------------------------------------------------------------------------
+                    # Discard the oldest incomplete packet, whose remaining fragments were likely lost.
+                    #--------------------------------------------------------------------------------
+                    del self.fragments[next(iter(self.fragments))]
+                self.fragments[fragment_id] = [None] * count
+            chunks = self.fragments[fragment_id]
+            chunks[index] = data
+            if None in chunks:
+                return
+            del self.fragments[fragment_id]
+
+        packet = b"".join(chunks)
+        if OscBundle.dgram_is_bundle(packet):
+            self.handle_bundle(OscBundle(packet))
+        else:
+            message = OscMessage(packet)
+            self.handle_osc(message.address, *message.params)
+
+    def handle_bundle(self, bundle: OscBundle):
+        for content in bundle:
+            if isinstance(content, OscBundle):
+                self.handle_bundle(content)
+            else:
+                self.handle_osc(content.address, *content.params)
+
     def stop(self):
         self.server.shutdown()
         self.server_thread.join()
         self.server = None
 
     def send_bundle(self,
-                    messages: list[tuple[str, tuple]]):
+                    messages: list[tuple[str, tuple]],
+                    timetag: float = IMMEDIATELY):
+        """
+        Send a list of messages as an OSC bundle.
 
-        import time
-        now = int(time.time())
-        bundle_builder = OscBundleBuilder(now)
+        Args:
+            messages: A list of (address, params) tuples.
+            timetag: The time at which to handle the messages, in seconds since the epoch
+                     (as returned by time.time()). By default, they are handled immediately.
+                     Bundles with a future time tag are handled on the first tick at or after that time.
+        """
+        bundle_builder = OscBundleBuilder(timetag)
         for address, params in messages:
             builder = OscMessageBuilder(address=address)
             for param in params:
@@ -73,6 +228,44 @@ class AbletonOSCClient:
         """
         self.client.send_message(address, params)
 
+    def send_reliable(self,
+                      address: str,
+                      params: Iterable = (),
+                      timeout: float = TICK_DURATION,
+                      retries: int = 3):
+        """
+        Send a message to the given OSC address, and wait for the server to acknowledge it,
+        retransmitting if no acknowledgement is received. The server handles each request
+        at most once, even if it is received several times.
+
+        Args:
+            address (str): The OSC address to send to (e.g. /live/song/set/tempo)
+            params (Iterable): Optional list of arguments to pass to the OSC message.
+            timeout (float): Number of seconds to wait for an acknowledgement before retransmitting.
+            retries (int): Number of times to retransmit before giving up.
+
+        Raises:
+            RuntimeError: If the server could not handle the message, or did not acknowledge it.
+        """
+        request_id = self.next_request_id
+        self.next_request_id = (self.next_request_id + 1) % (1 << 31)
+        event = threading.Event()
+        response = []
+        self.pending_calls[request_id] = (event, response)
+        try:
+            for attempt in range(retries + 1):
+                self.send_message(CALL_ADDRESS, (request_id, address, *params))
+                if event.wait(timeout):
+                    break
+        finally:
+            del self.pending_calls[request_id]
+
+        if not response:
+            raise RuntimeError("No acknowledgement received for: %s" % address)
+        response_address, response_params = response[0]
+        if response_address == NACK_ADDRESS:
+            raise RuntimeError("Error handling %s: %s" % (address, response_params[0]))
+
     def set_handler(self,
                     address: str,
                     fn: Callable = None):
@@ -19,6 +19,13 @@ class Manager(ControlSurface):
 
         self.handlers = []
         self.midi_mappings = {}
+        self.lease_duration = abletonosc.OSC_LEASE_DURATION
+        self.listeners_reclaimed = 0
+        self.tick_monitor = abletonosc.TickMonitor()
+        self.tick_stats_clients = []
+        self.profiler = None
+        self.profile_client = None
+        self.memory_tracer = abletonosc.MemoryTracer()
 
         try:
             self.osc_server = abletonosc.OSCServer()
@@ -43,6 +50,7 @@ class Manager(ControlSurface):
         log_dir = os.path.join(module_path, "logs")
         if not os.path.exists(log_dir):
             os.mkdir(log_dir, 0o755)
+        self.log_dir = log_dir
         log_path = os.path.join(log_dir, "abletonosc.log")
         self.log_file_handler = logging.FileHandler(log_path)
         self.log_file_handler.setLevel(self.log_level.upper())
@@ -82,12 +90,155 @@ class Manager(ControlSurface):
             self.log_file_handler.setLevel(self.log_level.upper())
         def show_message_callback(params):
             self.show_message(params[0])
+        def get_error_counts_callback(params):
+            return tuple(item for pair in self.osc_server.error_counts.items() for item in pair)
+        def get_metrics_callback(params):
+            metrics = self.osc_server.get_metrics()
+            metrics["listeners_reclaimed"] = self.listeners_reclaimed
+            return tuple(item for pair in metrics.items() for item in pair)
+        def get_tick_time_budget_callback(params):
+            return (self.osc_server.time_budget or 0.0,)
+        def set_tick_time_budget_callback(params):
+            self.osc_server.time_budget = float(params[0]) or None
+        def get_max_bundle_size_callback(params):
+            return (self.osc_server.max_bundle_size,)
+        def set_max_bundle_size_callback(params):
+            self.osc_server.max_bundle_size = int(params[0])
+        def get_max_datagram_size_callback(params):
+            return (self.osc_server.max_datagram_size,)
+        def set_max_datagram_size_callback(params):
+            self.osc_server.max_datagram_size = int(params[0])
+        def get_client_rate_limit_callback(params):
+            return (self.osc_server.rate_limiter.rate, self.osc_server.rate_limiter.burst)
+        def set_client_rate_limit_callback(params):
+            self.osc_server.rate_limiter.rate = float(params[0])
+            if len(params) > 1:
+                self.osc_server.rate_limiter.burst = int(params[1])
+        def get_throttled_clients_callback(params):
+            rate_limiter = self.osc_server.rate_limiter
+            return tuple(item
+                         for client, count in rate_limiter.throttled_counts.items()
+                         for item in (str(client), count, rate_limiter.dropped_counts[client]))
+        def set_sequence_numbers_callback(params):
+            self.osc_server.set_sequence_numbers(self.osc_server.remote_addr, bool(params[0]))
+        def get_multicast_callback(params):
+            multicast_addr = self.osc_server.multicast_addr
+            return multicast_addr if multicast_addr is not None else ("", 0)
+        def set_multicast_callback(params):
+            self.osc_server.set_multicast(self.osc_server.remote_addr, bool(params[0]))
+        def get_net_stats_callback(params):
+            return tuple(item for pair in self.osc_server.get_net_stats().items() for item in pair)
+        def set_socket_buffer_sizes_callback(params):
+            self.osc_server.set_socket_buffer_sizes(int(params[0]), int(params[1]))
+        def heartbeat_callback(params):
+            #--------------------------------------------------------------------------------
+            # Any message renews the sender's lease, so the heartbeat only needs to reply.
+            #--------------------------------------------------------------------------------
+            return (self.lease_duration,)
+        def get_lease_duration_callback(params):
+            return (self.lease_duration,)
+        def set_lease_duration_callback(params):
+            self.lease_duration = float(params[0])
+        def get_stats_callback(params):
+            return tuple(self.osc_server.handler_stats.flatten())
+        def reset_stats_callback(params):
+            self.osc_server.handler_stats.reset()
+        def get_stats_enabled_callback(params):
+            return (self.osc_server.stats_enabled,)
+        def set_stats_enabled_callback(params):
+            self.osc_server.stats_enabled = bool(params[0])
+        def get_tick_stats_callback(params):
+            return tuple(self.tick_monitor.get_summary())
+        def reset_tick_stats_callback(params):
+            self.tick_monitor.reset()
+        def start_listen_tick_stats_callback(params):
+            client = self.osc_server.remote_addr
+            if client not in self.tick_stats_clients:
+                self.tick_stats_clients.append(client)
+        def stop_listen_tick_stats_callback(params):
+            client = self.osc_server.remote_addr
+            if client in self.tick_stats_clients:
+                self.tick_stats_clients.remove(client)
+        def start_profile_callback(params):
+            #--------------------------------------------------------------------------------
+            # Params are either a number of ticks, or a number followed by "seconds".
+            #--------------------------------------------------------------------------------
+            if self.profiler is not None:
+                raise RuntimeError("Profiler is already running")
+            duration = params[0] if params else abletonosc.OSC_PROFILE_TICKS
+            if len(params) > 1 and params[1] == "seconds":
+                self.profiler = abletonosc.TickProfiler(seconds=float(duration))
+            else:
+                self.profiler = abletonosc.TickProfiler(ticks=int(duration))
+            self.profile_client = self.osc_server.remote_addr
+            logger.info("Started profiling for %s %s" % (duration, params[1] if len(params) > 1 else "ticks"))
+        def stop_profile_callback(params):
+            if self.profiler is None:
+                raise RuntimeError("Profiler is not running")
+            return self.stop_profile()
+        def get_memory_report_callback(params):
+            stats = self.osc_server.get_memory_stats()
+            for handler in self.handlers:
+                for name, value in handler.get_memory_stats().items():
+                    stats["%s_%s" % (handler.class_identifier, name)] = value
+            stats.update(self.memory_tracer.get_stats())
+            path = abletonosc.write_memory_report(self.log_dir, stats, self.memory_tracer.get_report())
+            logger.info("Wrote memory report to %s" % path)
+            return (path, *(item for pair in stats.items() for item in pair))
+        def start_memory_tracing_callback(params):
+            frames = int(params[0]) if params else 1
+            self.memory_tracer.start(frames)
+        def stop_memory_tracing_callback(params):
+            self.memory_tracer.stop()
+        def set_memory_baseline_callback(params):
+            if not self.memory_tracer.tracing:
+                raise RuntimeError("Memory tracing is not enabled")
+            self.memory_tracer.take_baseline()
+        def resync_callback(params):
+            client = self.osc_server.remote_addr
+            messages = [message for handler in self.handlers for message in handler.get_subscribed_messages(client)]
+            self.osc_server.notify_bundle(messages, client)
+            return (len(messages),)
 
         self.osc_server.add_handler("/live/test", test_callback)
         self.osc_server.add_handler("/live/api/reload", reload_callback)
         self.osc_server.add_handler("/live/api/get/log_level", get_log_level_callback)
         self.osc_server.add_handler("/live/api/set/log_level", set_log_level_callback)
         self.osc_server.add_handler("/live/api/show_message", show_message_callback)
+        self.osc_server.add_handler("/live/api/get/error_counts", get_error_counts_callback)
+        self.osc_server.add_handler("/live/api/get/metrics", get_metrics_callback)
+        self.osc_server.add_handler("/live/api/get/tick_time_budget", get_tick_time_budget_callback)
+        self.osc_server.add_handler("/live/api/set/tick_time_budget", set_tick_time_budget_callback)
+        self.osc_server.add_handler("/live/api/get/max_bundle_size", get_max_bundle_size_callback)
+        self.osc_server.add_handler("/live/api/set/max_bundle_size", set_max_bundle_size_callback)
+        self.osc_server.add_handler("/live/api/get/max_datagram_size", get_max_datagram_size_callback)
+        self.osc_server.add_handler("/live/api/set/max_datagram_size", set_max_datagram_size_callback)
+        self.osc_server.add_handler("/live/api/get/client_rate_limit", get_client_rate_limit_callback)
+        self.osc_server.add_handler("/live/api/set/client_rate_limit", set_client_rate_limit_callback)
+        self.osc_server.add_handler("/live/api/get/throttled_clients", get_throttled_clients_callback)
+        self.osc_server.add_handler("/live/api/set/sequence_numbers", set_sequence_numbers_callback)
+        self.osc_server.add_handler("/live/api/resync", resync_callback)
+        self.osc_server.add_handler("/live/api/heartbeat", heartbeat_callback)
+        self.osc_server.add_handler("/live/api/get/net_stats", get_net_stats_callback)
+        self.osc_server.add_handler("/live/api/set/socket_buffer_sizes", set_socket_buffer_sizes_callback)
+        self.osc_server.add_handler("/live/api/get/lease_duration", get_lease_duration_callback)
+        self.osc_server.add_handler("/live/api/set/lease_duration", set_lease_duration_callback)
+        self.osc_server.add_handler("/live/api/get/multicast", get_multicast_callback)
+        self.osc_server.add_handler("/live/api/set/multicast", set_multicast_callback)
+        self.osc_server.add_handler("/live/api/get/stats", get_stats_callback)
+        self.osc_server.add_handler("/live/api/reset/stats", reset_stats_callback)
+        self.osc_server.add_handler("/live/api/get/stats_enabled", get_stats_enabled_callback)
+        self.osc_server.add_handler("/live/api/set/stats_enabled", set_stats_enabled_callback)
+        self.osc_server.add_handler("/live/api/get/tick_stats", get_tick_stats_callback)
+        self.osc_server.add_handler("/live/api/reset/tick_stats", reset_tick_stats_callback)
+        self.osc_server.add_handler("/live/api/start_listen/tick_stats", start_listen_tick_stats_callback)
+        self.osc_server.add_handler("/live/api/stop_listen/tick_stats", stop_listen_tick_stats_callback)
+        self.osc_server.add_handler("/live/api/profile/start", start_profile_callback)
+        self.osc_server.add_handler("/live/api/profile/stop", stop_profile_callback)
+        self.osc_server.add_handler("/live/api/get/memory_report", get_memory_report_callback)
+        self.osc_server.add_handler("/live/api/memory/start_tracing", start_memory_tracing_callback)
+        self.osc_server.add_handler("/live/api/memory/stop_tracing", stop_memory_tracing_callback)
+        self.osc_server.add_handler("/live/api/memory/set_baseline", set_memory_baseline_callback)
 
         with self.component_guard():
             self.handlers = [
@@ -115,8 +266,103 @@ class Manager(ControlSurface):
         processes such as the OSC server to perform operations.
         """
         logger.debug("Tick...")
-        self.osc_server.process()
-        self.schedule_message(1, self.tick)
+        try:
+            self.tick_monitor.start_tick()
+            messages_handled = self.osc_server.messages_handled
+            profiler = self.start_profiling_tick()
+            self.osc_server.process()
+            self.release_closed_clients()
+            if self.lease_duration:
+                self.release_expired_clients()
+            self.osc_server.flush()
+            if profiler is not None:
+                profiler.end_tick()
+            self.tick_monitor.end_tick(self.osc_server.messages_handled - messages_handled)
+
+            #--------------------------------------------------------------------------------
+            # The profiler may have been stopped or replaced by a message handled in this tick.
+            #--------------------------------------------------------------------------------
+            if profiler is not None and profiler is self.profiler and profiler.finished:
+                try:
+                    self.osc_server.send("/live/api/profile/stop", self.stop_profile(), self.profile_client)
+                except Exception as e:
+                    logger.error("AbletonOSC: Error writing profile: %s" % e)
+
+            if self.tick_stats_clients and self.tick_monitor.ticks % abletonosc.OSC_TICK_STATS_INTERVAL == 0:
+                self.osc_server.notify("/live/api/get/tick_stats", tuple(self.tick_monitor.get_summary()), self.tick_stats_clients)
+        finally:
+            #--------------------------------------------------------------------------------
+            # Always reschedule, as an exception escaping a tick would otherwise stop
+            # AbletonOSC from handling any further messages.
+            #--------------------------------------------------------------------------------
+            self.schedule_message(1, self.tick)
+
+    def start_profiling_tick(self):
+        """
+        Enable the profiler, if one is running, for the duration of the current tick.
+        If it can't be enabled (e.g. because another profiler is active), it is discarded.
+
+        Returns:
+            The profiler, or None if profiling is not running.
+        """
+        profiler = self.profiler
+        if profiler is None:
+            return None
+        try:
+            profiler.start_tick()
+        except Exception as e:
+            self.profiler = None
+            logger.error("AbletonOSC: Error starting profiler: %s" % e)
+            return None
+        return profiler
+
+    def stop_profile(self):
+        """
+        Stop the profiler, and write its results to a .pstats file in the logs directory.
+
+        Returns:
+            The path of the .pstats file, followed by the location, call count and cumulative
+            time in milliseconds of each of the functions with the greatest cumulative time.
+            If nothing was profiled, no file is written, and the path is empty.
+        """
+        profiler, self.profiler = self.profiler, None
+        path = profiler.stop(self.log_dir)
+        if path is None:
+            logger.info("Profiling stopped before any ticks were profiled")
+            return ("",)
+        logger.info("Wrote profile of %d ticks to %s" % (profiler.ticks_profiled, path))
+        return (path, *profiler.get_top_functions())
+
+    def release_expired_clients(self):
+        """
+        Unsubscribe clients that have not sent a message (e.g. /live/api/heartbeat) within
+        the lease duration from all listeners, removing Live listeners with no remaining subscribers.
+        """
+        for client in self.osc_server.pop_expired_clients(self.lease_duration):
+            listener_count = self.release_client(client)
+            logger.info("Lease expired for client %s, removed %d listeners" % (str(client), listener_count))
+
+    def release_closed_clients(self):
+        """
+        Unsubscribe clients whose TCP connections have closed from all listeners.
+        """
+        for client in self.osc_server.pop_closed_clients():
+            listener_count = self.release_client(client)
+            logger.info("Connection closed for client %s, removed %d listeners" % (str(client), listener_count))
+
+    def release_client(self, client):
+        """
+        Unsubscribe a client from all listeners and tick stats, removing Live listeners
+        with no remaining subscribers.
+
+        Returns:
+            The number of Live listeners removed.
+        """
+        listener_count = sum(handler.release_client(client) for handler in self.handlers)
+        self.listeners_reclaimed += listener_count
+        if client in self.tick_stats_clients:
+            self.tick_stats_clients.remove(client)
+        return listener_count
 
     def reload_imports(self):
         try:
@@ -124,8 +370,16 @@ class Manager(ControlSurface):
             importlib.reload(abletonosc.clip)
             importlib.reload(abletonosc.clip_slot)
             importlib.reload(abletonosc.device)
+            importlib.reload(abletonosc.encoder)
             importlib.reload(abletonosc.handler)
+            importlib.reload(abletonosc.memory)
+            importlib.reload(abletonosc.rate_limiter)
+            importlib.reload(abletonosc.router)
+            importlib.reload(abletonosc.stats)
+            importlib.reload(abletonosc.tcp)
+            importlib.reload(abletonosc.tick_monitor)
             importlib.reload(abletonosc.osc_server)
+            importlib.reload(abletonosc.profiler)
             importlib.reload(abletonosc.scene)
             importlib.reload(abletonosc.song)
             importlib.reload(abletonosc.track)
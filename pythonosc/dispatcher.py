@@ -2,6 +2,7 @@
 """
 
 import collections
+import functools
 import logging
 import re
 import time
@@ -10,6 +11,24 @@ from typing import overload, List, Union, Any, Generator, Tuple, Callable, Optio
 from .osc_message import OscMessage
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_address_pattern(address_pattern: str) -> "re.Pattern":
+    """Compiles an OSC address pattern into a regexp, caching the result."""
+    # First convert the address_pattern into a matchable regexp.
+    # '?' in the OSC Address Pattern matches any single character.
+    # Let's consider numbers and _ "characters" too here, it's not said
+    # explicitly in the specification but it sounds good.
+    escaped_address_pattern = re.escape(address_pattern)
+    pattern = escaped_address_pattern.replace('\\?', '\\w?')
+    # '*' in the OSC Address Pattern matches any sequence of zero or more
+    # characters.
+    pattern = pattern.replace('\\*', '[\w|\+]*')
+    # The rest of the syntax in the specification is like the re module so
+    # we're fine.
+    pattern = pattern + '$'
+    return re.compile(pattern)
+
+
 class Handler(object):
     """Wrapper for a callback function that will be called when an OSC message is sent to the right address.
 
@@ -142,19 +161,7 @@ class Dispatcher(object):
         Returns:
             Generator yielding Handlers matching address_pattern
         """
-        # First convert the address_pattern into a matchable regexp.
-        # '?' in the OSC Address Pattern matches any single character.
-        # Let's consider numbers and _ "characters" too here, it's not said
-        # explicitly in the specification but it sounds good.
-        escaped_address_pattern = re.escape(address_pattern)
-        pattern = escaped_address_pattern.replace('\\?', '\\w?')
-        # '*' in the OSC Address Pattern matches any sequence of zero or more
-        # characters.
-        pattern = pattern.replace('\\*', '[\w|\+]*')
-        # The rest of the syntax in the specification is like the re module so
-        # we're fine.
-        pattern = pattern + '$'
-        patterncompiled = re.compile(pattern)
+        patterncompiled = _compile_address_pattern(address_pattern)
         matched = False
 
         for addr, handlers in self._map.items():
@@ -45,7 +45,7 @@ class OscBundle(object):
             # The size is an int32 representing the number of 8-bit bytes in the
             # contents, and will always be a multiple of 4. The contents are either
             # an OSC Message or an OSC Bundle.
-            while self._dgram[index:]:
+            while index < len(self._dgram):
                 # Get the sub content size.
                 content_size, index = osc_types.get_int(self._dgram, index)
                 # Get the datagram for the sub content.
@@ -68,7 +68,7 @@ class OscBundle(object):
     @staticmethod
     def dgram_is_bundle(dgram: bytes) -> bool:
         """Returns whether this datagram starts like an OSC bundle."""
-        return dgram.startswith(_BUNDLE_PREFIX)
+        return dgram[:len(_BUNDLE_PREFIX)] == _BUNDLE_PREFIX
 
     @property
     def timestamp(self) -> float:
@@ -85,7 +85,8 @@ def get_string(dgram: bytes, start_index: int) -> Tuple[str, int]:
         # do it ourselves.
         if offset > len(dgram[start_index:]):
             raise ParseError('Datagram is too short')
-        data_str = dgram[start_index:start_index + offset]
+        # Convert to bytes, as dgram may be a memoryview.
+        data_str = bytes(dgram[start_index:start_index + offset])
         return data_str.replace(b'\x00', b'').decode('utf-8'), start_index + offset
     except IndexError as ie:
         raise ParseError('Could not parse datagram %s' % ie)
@@ -251,7 +252,7 @@ def get_float(dgram: bytes, start_index: int) -> Tuple[float, int]:
             # Noticed that Reaktor doesn't send the last bunch of \x00 needed to make
             # the float representation complete in some cases, thus we pad here to
             # account for that.
-            dgram = dgram + b'\x00' * (_FLOAT_DGRAM_LEN - len(dgram[start_index:]))
+            dgram = bytes(dgram) + b'\x00' * (_FLOAT_DGRAM_LEN - len(dgram[start_index:]))
         return (
             struct.unpack('>f',
                           dgram[start_index:start_index + _FLOAT_DGRAM_LEN])[0],
@@ -320,7 +321,7 @@ def get_blob(dgram: bytes, start_index: int) -> Tuple[bytes, int]:
     end_index = int_offset + size
     if end_index - start_index > len(dgram[start_index:]):
         raise ParseError('Datagram is too short.')
-    return dgram[int_offset:int_offset + size], int_offset + total_size
+    return bytes(dgram[int_offset:int_offset + size]), int_offset + total_size
 
 
 def write_blob(val: bytes) -> bytes:
@@ -1,4 +1,5 @@
 from . import client, wait_one_tick
+import pytest
 
 #--------------------------------------------------------------------------------
 # Test generic application features
@@ -15,3 +16,181 @@ def test_application_error(client):
     client.send_message("/live/clip/get/color", (0, 10))
     response = client.await_message("/live/error")
     assert response[0] == "Error handling OSC message: Index out of range"
+
+def test_application_error_isolation(client):
+    #--------------------------------------------------------------------------------
+    # A failing message must not prevent later messages in the same tick from
+    # being handled.
+    #--------------------------------------------------------------------------------
+    client.send_message("/live/clip/get/color", (0, 10))
+    assert client.query("/live/test") == ("ok",)
+    error_counts = client.query("/live/api/get/error_counts")
+    error_counts = dict(zip(error_counts[::2], error_counts[1::2]))
+    assert error_counts["/live/clip/get/color"] >= 1
+
+def test_application_error_counts_pattern(client):
+    #--------------------------------------------------------------------------------
+    # Errors for distinct wildcard patterns are counted under a single key.
+    #--------------------------------------------------------------------------------
+    for pattern in ("/live/track/get/[]", "/live/track/get/[z-a]", "/live/clip/get/[]"):
+        client.send_message(pattern, (0,))
+    error_counts = client.query("/live/api/get/error_counts")
+    error_counts = dict(zip(error_counts[::2], error_counts[1::2]))
+    assert error_counts["pattern"] >= 3
+    assert "/live/track/get/[]" not in error_counts
+
+def test_application_metrics(client):
+    metrics = client.query("/live/api/get/metrics")
+    metrics = dict(zip(metrics[::2], metrics[1::2]))
+    assert metrics["backlog_depth"] == 0
+    assert "budget_overruns" in metrics
+
+def test_application_tick_time_budget(client):
+    client.send_message("/live/api/set/tick_time_budget", (0.02,))
+    assert client.query("/live/api/get/tick_time_budget")[0] == pytest.approx(0.02)
+    client.send_message("/live/api/set/tick_time_budget", (0.05,))
+    assert client.query("/live/api/get/tick_time_budget")[0] == pytest.approx(0.05)
+
+def test_application_tick_time_budget_backlog(client):
+    #--------------------------------------------------------------------------------
+    # With a small time budget, a burst that can't be handled within one tick is
+    # carried over to the following ticks, rather than being dropped.
+    #--------------------------------------------------------------------------------
+    metrics = client.query("/live/api/get/metrics")
+    budget_overruns = dict(zip(metrics[::2], metrics[1::2]))["budget_overruns"]
+
+    replies = []
+    client.set_handler("/live/test", lambda address, params: replies.append(params))
+    client.send_message("/live/api/set/tick_time_budget", (0.0005,))
+    for _ in range(200):
+        client.send_message("/live/test")
+    for _ in range(10):
+        wait_one_tick()
+    client.remove_handler("/live/test")
+    client.send_message("/live/api/set/tick_time_budget", (0.05,))
+
+    metrics = client.query("/live/api/get/metrics")
+    metrics = dict(zip(metrics[::2], metrics[1::2]))
+    assert metrics["budget_overruns"] > budget_overruns
+    assert metrics["backlog_depth"] == 0
+    assert len(replies) == 200
+
+def test_application_fragmented_reply(client):
+    #--------------------------------------------------------------------------------
+    # With a small maximum datagram size, the metrics reply is split into fragments,
+    # which the client reassembles.
+    #--------------------------------------------------------------------------------
+    client.send_message("/live/api/set/max_datagram_size", (128,))
+    metrics = client.query("/live/api/get/metrics")
+    client.send_message("/live/api/set/max_datagram_size", (8192,))
+    metrics = dict(zip(metrics[::2], metrics[1::2]))
+    assert metrics["fragmented_packets"] >= 1
+
+def test_application_client_rate_limit(client):
+    client.send_message("/live/api/set/client_rate_limit", (1000, 500))
+    assert client.query("/live/api/get/client_rate_limit") == (1000, 500)
+    assert client.query("/live/test") == ("ok",)
+    client.send_message("/live/api/set/client_rate_limit", (0, 200))
+
+def test_application_client_rate_limit_throttling(client):
+    #--------------------------------------------------------------------------------
+    # A burst above the rate limit is throttled, and handled as tokens are replenished.
+    #--------------------------------------------------------------------------------
+    metrics = client.query("/live/api/get/metrics")
+    packets_throttled = dict(zip(metrics[::2], metrics[1::2]))["packets_throttled"]
+
+    replies = []
+    client.set_handler("/live/test", lambda address, params: replies.append(params))
+    client.send_message("/live/api/set/client_rate_limit", (50, 10))
+    for _ in range(50):
+        client.send_message("/live/test")
+    wait_one_tick()
+    assert len(replies) < 50
+    for _ in range(15):
+        wait_one_tick()
+    client.remove_handler("/live/test")
+    client.send_message("/live/api/set/client_rate_limit", (0, 200))
+
+    metrics = client.query("/live/api/get/metrics")
+    metrics = dict(zip(metrics[::2], metrics[1::2]))
+    assert metrics["packets_throttled"] > packets_throttled
+    assert len(replies) == 50
+
+def test_application_resync(client):
+    client.enable_sequence_numbers(resync_on_gap=False)
+    client.send_message("/live/song/start_listen/tempo")
+    client.await_message("/live/song/get/tempo")
+
+    assert client.query("/live/api/resync")[0] >= 1
+    assert client.sequence_number is not None
+
+    client.send_message("/live/song/stop_listen/tempo")
+    client.send_message("/live/api/set/sequence_numbers", (0,))
+
+def test_application_call(client):
+    client.send_reliable("/live/song/set/tempo", (123.0,))
+    assert client.query("/live/song/get/tempo") == (123.0,)
+    with pytest.raises(RuntimeError):
+        client.send_reliable("/live/clip/get/color", (0, 10))
+    client.send_reliable("/live/song/set/tempo", (120.0,))
+
+def test_application_lease_duration(client):
+    client.send_message("/live/api/set/lease_duration", (30.0,))
+    assert client.query("/live/api/heartbeat") == (30.0,)
+    client.send_message("/live/api/set/lease_duration", (0.0,))
+    assert client.query("/live/api/get/lease_duration") == (0.0,)
+
+def test_application_lease_expiry(client):
+    #--------------------------------------------------------------------------------
+    # A client that sends nothing for the lease duration is unsubscribed from its listeners.
+    #--------------------------------------------------------------------------------
+    def get_song_subscriptions():
+        rv = client.query("/live/api/get/memory_report")
+        return dict(zip(rv[1::2], rv[2::2]))["song_subscriptions"]
+
+    client.send_message("/live/api/set/lease_duration", (0.5,))
+    client.send_message("/live/song/start_listen/tempo")
+    client.await_message("/live/song/get/tempo")
+    song_subscriptions = get_song_subscriptions()
+    assert song_subscriptions >= 1
+
+    for _ in range(8):
+        wait_one_tick()
+    assert get_song_subscriptions() == song_subscriptions - 1
+    client.send_message("/live/api/set/lease_duration", (0.0,))
+
+def test_application_net_stats(client):
+    net_stats = client.query("/live/api/get/net_stats")
+    net_stats = dict(zip(net_stats[::2], net_stats[1::2]))
+    assert net_stats["rx_packets"] > 0
+    assert net_stats["recv_buffer_size"] > 0
+
+def test_application_stats(client):
+    client.send_message("/live/api/set/stats_enabled", (1,))
+    client.send_message("/live/api/reset/stats")
+    client.query("/live/test")
+    stats = client.query("/live/api/get/stats")
+    index = stats.index("/live/test")
+    assert stats[index + 1] == 1
+    assert stats[index + 2] == 0
+    client.send_message("/live/api/set/stats_enabled", (0,))
+    assert client.query("/live/api/get/stats_enabled") == (False,)
+
+def test_application_tick_stats(client):
+    wait_one_tick()
+    tick_stats = client.query("/live/api/get/tick_stats")
+    tick_stats = dict(zip(tick_stats[::2], tick_stats[1::2]))
+    assert tick_stats["ticks"] > 0
+    assert tick_stats["duration_ms_max"] >= tick_stats["duration_ms_p50"] >= 0
+
+def test_application_profile(client):
+    client.send_message("/live/api/profile/start", (2,))
+    rv = client.await_message("/live/api/profile/stop", timeout=1.0)
+    assert rv[0].endswith(".pstats")
+    assert len(rv[1:]) % 3 == 0
+
+def test_application_memory_report(client):
+    rv = client.query("/live/api/get/memory_report")
+    assert rv[0].endswith(".txt")
+    memory_stats = dict(zip(rv[1::2], rv[2::2]))
+    assert memory_stats["track_listeners"] >= 0
@@ -1,3 +1,5 @@
+import time
+
 from . import client, wait_one_tick
 
 #--------------------------------------------------------------------------------
@@ -19,3 +21,41 @@ def test_bundle(client):
 
     wait_one_tick()
     assert reply_count == 3
+
+def test_bundle_replies(client):
+    reply_count = 0
+    def count_replies(address, params):
+        nonlocal reply_count
+        reply_count += 1
+    client.set_handler("/live/song/get/tempo", count_replies)
+
+    client.send_message("/live/api/set/max_bundle_size", (1400,))
+    assert client.query("/live/api/get/max_bundle_size") == (1400,)
+    client.send_bundle([
+        ("/live/song/get/tempo", tuple()),
+        ("/live/song/get/tempo", tuple()),
+        ("/live/song/get/tempo", tuple())
+    ])
+
+    wait_one_tick()
+    client.send_message("/live/api/set/max_bundle_size", (0,))
+    client.remove_handler("/live/song/get/tempo")
+    assert reply_count == 3
+
+def test_bundle_scheduled(client):
+    reply_count = 0
+    def count_replies(address, params):
+        nonlocal reply_count
+        reply_count += 1
+    client.set_handler("/live/song/get/tempo", count_replies)
+
+    client.send_bundle([
+        ("/live/song/get/tempo", tuple())
+    ], time.time() + 0.5)
+
+    wait_one_tick()
+    assert reply_count == 0
+    time.sleep(0.5)
+    wait_one_tick()
+    client.remove_handler("/live/song/get/tempo")
+    assert reply_count == 1
@@ -0,0 +1,23 @@
+import pytest
+from . import client, wait_one_tick
+
+#--------------------------------------------------------------------------------
+# Multicast listener updates. Only runs if AbletonOSC has been configured with
+# an OSC_MULTICAST_GROUP.
+#--------------------------------------------------------------------------------
+
+def test_multicast_listen(client):
+    group, port = client.query("/live/api/get/multicast")
+    if not group:
+        pytest.skip("Multicast not enabled")
+
+    client.enable_multicast()
+    client.send_message("/live/song/start_listen/tempo")
+    client.await_message("/live/song/get/tempo")
+    client.send_message("/live/song/set/tempo", (125.0,))
+    assert client.await_message("/live/song/get/tempo") == (125.0,)
+
+    client.send_message("/live/song/stop_listen/tempo")
+    client.send_message("/live/api/set/multicast", (0,))
+    client.send_message("/live/song/set/tempo", (120.0,))
+    wait_one_tick()
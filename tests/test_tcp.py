@@ -0,0 +1,28 @@
+import socket
+
+from pythonosc.osc_message import OscMessage
+from pythonosc.osc_message_builder import OscMessageBuilder
+
+#--------------------------------------------------------------------------------
+# OSC over TCP, with SLIP framing (OSC 1.1)
+#--------------------------------------------------------------------------------
+
+SLIP_END = b"\xc0"
+
+def slip_encode(packet: bytes) -> bytes:
+    return SLIP_END + packet.replace(b"\xdb", b"\xdb\xdd").replace(SLIP_END, b"\xdb\xdc") + SLIP_END
+
+def test_tcp_query():
+    connection = socket.create_connection(("127.0.0.1", 11000), timeout=1.0)
+    message = OscMessageBuilder("/live/song/get/tempo").build()
+    connection.sendall(slip_encode(message.dgram))
+
+    data = b""
+    while data.count(SLIP_END) < 2:
+        data += connection.recv(65536)
+    connection.close()
+
+    frame = data.split(SLIP_END)[1]
+    reply = OscMessage(frame.replace(b"\xdb\xdc", SLIP_END).replace(b"\xdb\xdd", b"\xdb"))
+    assert reply.address == "/live/song/get/tempo"
+    assert len(reply.params) == 1
@@ -19,6 +19,15 @@ def test_track_property_panning(client):
 def test_track_property_volume(client):
     _test_track_property(client, 2, "volume", [0.5, 1.0])
 
+def test_track_property_volume_coalesced(client):
+    #--------------------------------------------------------------------------------
+    # A burst of writes within one tick is applied as the last value.
+    #--------------------------------------------------------------------------------
+    for value in [0.1, 0.2, 0.3, 0.4, 0.5]:
+        client.send_message("/live/track/set/volume", [2, value])
+    assert client.query("/live/track/get/volume", [2]) == (2, 0.5)
+    client.send_message("/live/track/set/volume", [2, 0.85])
+
 def test_track_property_color(client):
     # Only specific colors from the color picker can be used
     _test_track_property(client, 2, "color", [0x001AFF2F, 0x001A2F96])
@@ -107,3 +116,50 @@ def test_track_listen_playing_slot_index(client):
 
     for track_id, clip_id in itertools.product((0, 1), (0, 1)):
         client.send_message("/live/clip_slot/delete_clip", (track_id, clip_id))
+
+#--------------------------------------------------------------------------------
+# Test track wildcard queries
+#--------------------------------------------------------------------------------
+
+def test_track_get_wildcard(client):
+    received = {}
+    def record_reply(address, params):
+        received[address] = params
+    for address in ("/live/track/get/mute", "/live/track/get/name", "/live/track/get/clips/name"):
+        client.set_handler(address, record_reply)
+
+    client.send_message("/live/track/get/*", (0,))
+    wait_one_tick()
+    for address in ("/live/track/get/mute", "/live/track/get/name", "/live/track/get/clips/name"):
+        client.remove_handler(address)
+
+    assert received["/live/track/get/mute"][0] == 0
+    assert received["/live/track/get/name"][0] == 0
+    assert "/live/track/get/clips/name" not in received
+
+def test_track_get_wildcard_patterns(client):
+    received = {}
+    def record_reply(address, params):
+        received[address] = params
+    for address in ("/live/track/get/mute", "/live/track/get/name", "/live/track/get/solo"):
+        client.set_handler(address, record_reply)
+
+    for pattern, expected in (("/live/track/get/n?me", {"/live/track/get/name"}),
+                              ("/live/track/get/[m]ute", {"/live/track/get/mute"}),
+                              ("/live/track/get/[a-n]ute", {"/live/track/get/mute"}),
+                              ("/live/track/get/[!a-n]olo", {"/live/track/get/solo"}),
+                              ("/live/track/get/{mute,solo}", {"/live/track/get/mute", "/live/track/get/solo"})):
+        received.clear()
+        client.send_message(pattern, (0,))
+        wait_one_tick()
+        assert set(received) == expected
+        assert all(params[0] == 0 for params in received.values())
+
+    for address in ("/live/track/get/mute", "/live/track/get/name", "/live/track/get/solo"):
+        client.remove_handler(address)
+
+def test_track_get_wildcard_invalid(client):
+    for pattern in ("/live/track/get/[]", "/live/track/get/[z-a]ute"):
+        client.send_message(pattern, (0,))
+        response = client.await_message("/live/error")
+        assert response[0].startswith("Error handling OSC message: Invalid OSC address pattern")
@@ -0,0 +1,30 @@
+import os
+import socket
+import tempfile
+import pytest
+
+from pythonosc.osc_message import OscMessage
+from pythonosc.osc_message_builder import OscMessageBuilder
+
+#--------------------------------------------------------------------------------
+# OSC over a Unix domain datagram socket. Only runs if AbletonOSC has been
+# configured to listen on OSC_UNIX_SOCKET_PATH = "/tmp/abletonosc.sock".
+#--------------------------------------------------------------------------------
+
+SERVER_PATH = "/tmp/abletonosc.sock"
+
+@pytest.mark.skipif(not os.path.exists(SERVER_PATH), reason="Unix socket not enabled")
+def test_unix_socket_query():
+    client_path = os.path.join(tempfile.mkdtemp(), "client.sock")
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    connection.bind(client_path)
+    connection.settimeout(1.0)
+
+    message = OscMessageBuilder("/live/song/get/tempo").build()
+    connection.sendto(message.dgram, SERVER_PATH)
+    reply = OscMessage(connection.recv(65536))
+    connection.close()
+    os.unlink(client_path)
+
+    assert reply.address == "/live/song/get/tempo"
+    assert len(reply.params) == 1